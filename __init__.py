@@ -28,6 +28,7 @@ _adapter.inject_path(r"D:\COMPUTATIONAL\Python_dev\.venv311\Lib\site-packages")
 
 from blender_adapter.core.node import NodeRNA
 from blender_adapter.core.frame import FrameRNA
+from blender_adapter.core.ids import IdCounterRNA
 
 from blender_adapter.operators.draw_node import DrawNode
 from blender_adapter.operators.draw_frame import DrawFrame
@@ -35,11 +36,13 @@ from blender_adapter.operators.draw_frame import DrawFrame
 from blender_adapter.operators.object_move import MoveObject
 from blender_adapter.operators.object_delete import DeleteObject
 from blender_adapter.operators.object_replicate import ReplicateObject
+from blender_adapter.operators.object_pattern import PatternArray
 
 from blender_adapter.operators.set_origin import SetOriginOperator
 
 from blender_adapter.ui.panel_main import (
     SoM_DisplaySettings,
+    SoM_ModelSettings,
     SoM_main_panel,
     OBJECT_panel_node,
 )
@@ -47,6 +50,7 @@ from blender_adapter.ui.panel_main import (
 BLENDER_CLASSES = (
     NodeRNA,
     FrameRNA,
+    IdCounterRNA,
 
     DrawNode, 
     DrawFrame,
@@ -54,10 +58,12 @@ BLENDER_CLASSES = (
     MoveObject,
     DeleteObject,
     ReplicateObject,
+    PatternArray,
 
     SetOriginOperator,
 
     SoM_DisplaySettings,
+    SoM_ModelSettings,
     SoM_main_panel,
     OBJECT_panel_node,
 )
@@ -67,12 +73,20 @@ BLENDER_CLASSES = (
 # -------------------------------------------------------------------
 
 from blender_adapter.service.label.base import ServiceRegistry
-from blender_adapter.service.label.node import NodeLabel
-from blender_adapter.service.label.frame import FrameLabel
+from blender_adapter.service.label.overlay import label_overlay
+from blender_adapter.service.id_allocator import id_allocator
+from blender_adapter.service.registry import domain_registry
+from blender_adapter.service.snap_cache import snap_point_cache
+from blender_adapter.service.selection import selection_cache
+from blender_adapter.service.wrappers import wrapper_cache
 
 services = ServiceRegistry()
-services.add(NodeLabel())
-services.add(FrameLabel())
+services.add(id_allocator)
+services.add(domain_registry)
+services.add(snap_point_cache)
+services.add(selection_cache)
+services.add(wrapper_cache)
+services.add(label_overlay)
 
 # -------------------------------------------------------------------
 # Registration
@@ -89,6 +103,10 @@ def register():
     bpy.types.Scene.som_display = bpy.props.PointerProperty(
         type=SoM_DisplaySettings
     )
+    bpy.types.Scene.som_ids = bpy.props.PointerProperty(type=IdCounterRNA)
+    bpy.types.Scene.som_model = bpy.props.PointerProperty(
+        type=SoM_ModelSettings
+    )
 
     # 3. Enable runtime services
     services.enable_all()
@@ -108,6 +126,12 @@ def unregister():
     if hasattr(bpy.types.Scene, "som_display"):
         del bpy.types.Scene.som_display
 
+    if hasattr(bpy.types.Scene, "som_ids"):
+        del bpy.types.Scene.som_ids
+
+    if hasattr(bpy.types.Scene, "som_model"):
+        del bpy.types.Scene.som_model
+
     if hasattr(bpy.types.Object, "node_rna"):
         del bpy.types.Object.node_rna
 
@@ -0,0 +1,58 @@
+# blender_adapter/benchmarks/bench_create_nodes.py
+#
+# Run inside Blender with the add-on enabled:
+#     blender -b --python benchmarks/bench_create_nodes.py
+
+import time
+
+import bpy
+import numpy as np
+
+from blender_adapter.crud.node import BlenderNodeAdapter
+
+SIZES = (1_000, 10_000, 100_000)
+
+
+def _fresh_collection(name):
+    coll = bpy.data.collections.new(name)
+    bpy.context.scene.collection.children.link(coll)
+    return coll
+
+
+def _clear(coll):
+    bpy.data.batch_remove(list(coll.objects))
+    bpy.data.collections.remove(coll)
+
+
+def bench_loop(locations):
+    coll = _fresh_collection("bench_loop")
+    t0 = time.perf_counter()
+    for loc in locations:
+        BlenderNodeAdapter.create(location=loc, collection=coll)
+    elapsed = time.perf_counter() - t0
+    _clear(coll)
+    return elapsed
+
+
+def bench_bulk(locations):
+    coll = _fresh_collection("bench_bulk")
+    t0 = time.perf_counter()
+    BlenderNodeAdapter.create_many(locations, collection=coll)
+    elapsed = time.perf_counter() - t0
+    _clear(coll)
+    return elapsed
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'N':>8} {'loop [s]':>10} {'bulk [s]':>10} {'speedup':>8}")
+
+    for n in SIZES:
+        locations = rng.uniform(-100.0, 100.0, size=(n, 3)).astype(np.float32)
+        t_loop = bench_loop(locations)
+        t_bulk = bench_bulk(locations)
+        print(f"{n:>8} {t_loop:>10.3f} {t_bulk:>10.3f} {t_loop / t_bulk:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# blender_adapter/benchmarks/bench_geometry.py
+#
+# Run inside Blender with the add-on enabled:
+#     blender -b --python benchmarks/bench_geometry.py
+
+import time
+
+import bpy
+import numpy as np
+from mathutils import Vector
+
+from blender_adapter.utils.geometry import centroid, extremes, world_vertices
+
+SIZES = (2, 100, 10_000, 1_000_000)
+REPEAT = 5
+
+
+def _make_object(n):
+    rng = np.random.default_rng(n)
+    mesh = bpy.data.meshes.new(f"bench_{n}")
+    mesh.vertices.add(n)
+    mesh.vertices.foreach_set("co", rng.uniform(-10, 10, n * 3).astype(np.float32))
+    obj = bpy.data.objects.new(f"bench_{n}", mesh)
+    obj.location = (1.0, 2.0, 3.0)
+    return obj
+
+
+def python_loop(obj):
+    verts = [obj.matrix_world @ v.co for v in obj.data.vertices]
+    lo = min(verts, key=lambda v: (v.x, v.y, v.z))
+    hi = max(verts, key=lambda v: (v.x, v.y, v.z))
+    center = sum(verts, Vector()) / len(verts)
+    return lo, hi, center
+
+
+def numpy_kernel(obj):
+    world = world_vertices(obj)
+    lo, hi = extremes(world)
+    return lo, hi, centroid(world)
+
+
+def _time(func, obj):
+    best = float("inf")
+    for _ in range(REPEAT):
+        t0 = time.perf_counter()
+        func(obj)
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def main():
+    print(f"{'verts':>9} {'loop [ms]':>11} {'numpy [ms]':>11} {'speedup':>8}")
+
+    for n in SIZES:
+        obj = _make_object(n)
+        t_loop = _time(python_loop, obj)
+        t_np = _time(numpy_kernel, obj)
+        print(f"{n:>9} {t_loop * 1e3:>11.3f} {t_np * 1e3:>11.3f} {t_loop / t_np:>7.1f}x")
+
+        mesh = obj.data
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(mesh)
+
+
+if __name__ == "__main__":
+    main()
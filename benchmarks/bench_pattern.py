@@ -0,0 +1,117 @@
+# blender_adapter/benchmarks/bench_pattern.py
+#
+# Run inside Blender with the add-on enabled:
+#     blender -b --python benchmarks/bench_pattern.py
+#
+# One bay (4 nodes, 4 columns + 4 beams) patterned into a
+# 10 × 10 × 20 grid with the old per-copy replicate (one ReplicateObject
+# call per grid cell) vs the pattern array.
+
+import itertools
+import time
+
+import bpy
+
+from blender_adapter.crud.frame import BlenderFrameAdapter
+from blender_adapter.crud.node import BlenderNodeAdapter
+from blender_adapter.service.selection import selection_cache
+
+GRID = (10, 10, 20)
+SPACING = (6.0, 6.0, 3.5)
+
+
+def _fresh_collection(name):
+    coll = bpy.data.collections.new(name)
+    bpy.context.scene.collection.children.link(coll)
+    return coll
+
+
+def _clear(coll):
+    meshes = [obj.data for obj in coll.objects if obj.type == 'MESH']
+    bpy.data.batch_remove(list(coll.objects) + meshes)
+    bpy.data.collections.remove(coll)
+
+
+def _bay(coll):
+    dx, dy, dz = SPACING
+    base = [(0, 0, 0), (dx, 0, 0), (dx, dy, 0), (0, dy, 0)]
+    top = [(x, y, dz) for x, y, _z in base]
+
+    nodes = [
+        BlenderNodeAdapter.create(location=loc, collection=coll)
+        for loc in top
+    ]
+    frames = [
+        BlenderFrameAdapter.create(
+            start=b, end=t, start_node_id="", end_node_id=n.id, collection=coll
+        )
+        for b, t, n in zip(base, top, nodes)
+    ]
+    frames += [
+        BlenderFrameAdapter.create(
+            start=top[i],
+            end=top[(i + 1) % 4],
+            start_node_id=nodes[i].id,
+            end_node_id=nodes[(i + 1) % 4].id,
+            collection=coll,
+        )
+        for i in range(4)
+    ]
+    return [n.obj for n in nodes] + [f.obj for f in frames]
+
+
+def _select(objs):
+    bpy.ops.object.select_all(action='DESELECT')
+    for obj in objs:
+        obj.select_set(True)
+    bpy.context.view_layer.objects.active = objs[0]
+    # no event loop in -b runs → depsgraph handlers may not have fired
+    # yet, and the operator's poll() reads the cached selection
+    selection_cache.invalidate()
+
+
+def bench_replicate():
+    coll = _fresh_collection("bench_replicate")
+    bay = _bay(coll)
+
+    t0 = time.perf_counter()
+    for ix, iy, iz in itertools.product(*map(range, GRID)):
+        if (ix, iy, iz) == (0, 0, 0):
+            continue
+        _select(bay)
+        bpy.ops.som.replicate_object(
+            dx=ix * SPACING[0], dy=iy * SPACING[1], dz=iz * SPACING[2]
+        )
+    elapsed = time.perf_counter() - t0
+
+    count = len(coll.objects)
+    _clear(coll)
+    return elapsed, count
+
+
+def bench_pattern():
+    coll = _fresh_collection("bench_pattern")
+    _select(_bay(coll))
+
+    t0 = time.perf_counter()
+    bpy.ops.som.pattern_array(
+        pattern='GRID', grid_count=GRID, spacing=SPACING
+    )
+    elapsed = time.perf_counter() - t0
+
+    count = len(coll.objects)
+    _clear(coll)
+    return elapsed, count
+
+
+def main():
+    for name, bench in (
+        ("replicate", bench_replicate),
+        ("pattern", bench_pattern),
+    ):
+        elapsed, count = bench()
+        print(f"{name:9s} {GRID}: {count} objects in {elapsed:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
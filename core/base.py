@@ -1,3 +1,9 @@
 class DomainKind:
     NODE = "Node"
     FRAME = "Frame"
+    FRAME_STORE = "FrameStore"
+
+class FrameStorage:
+    OBJECT = "OBJECT"   # one object + one mesh per frame
+    SHARED = "SHARED"   # one object per frame, all using one unit mesh
+    EDGES = "EDGES"     # all frames of a collection as edges of one mesh
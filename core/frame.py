@@ -1,9 +1,17 @@
 # blender_adapter/core/frame_rna.py
 
 import bpy
+import numpy as np
+from mathutils import Vector
 from blender_adapter.core.base import DomainKind
 
+# ID property flagging the shared unit-segment mesh (FrameStorage.SHARED):
+# vertices (-0.5, 0, 0) / (0.5, 0, 0), endpoints live in matrix_world
+UNIT_MESH_FLAG = "som_unit_frame"
+
 class BlenderFrame:
+    __slots__ = ("obj",)
+
     TYPE = DomainKind.FRAME
 
     def __init__(self, obj: bpy.types.Object):
@@ -41,6 +49,130 @@ class BlenderFrame:
     def mesh(self) -> bpy.types.Mesh:
         return self.obj.data
 
+    @property
+    def is_unit(self) -> bool:
+        mesh = self.obj.data
+        return mesh is not None and bool(mesh.get(UNIT_MESH_FLAG))
+
+    def endpoints(self) -> tuple[Vector, Vector] | None:
+        """
+        World-space (start, end); unit-mesh frames never touch vertices.
+        """
+        mw = self.obj.matrix_world
+
+        if self.is_unit:
+            half = mw.col[0].xyz * 0.5
+            mid = mw.translation
+            return mid - half, mid + half
+
+        mesh = self.obj.data
+        if not mesh or len(mesh.vertices) < 2:
+            return None
+
+        return mw @ mesh.vertices[0].co, mw @ mesh.vertices[1].co
+
+    # --- selection ---
+
+    def select(self, context):
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        bpy.ops.object.select_all(action='DESELECT')
+        self.obj.select_set(True)
+        context.view_layer.objects.active = self.obj
+
+# Integer EDGE attributes of a consolidated frame store mesh
+ATTR_FRAME_ID = "frame_id"
+ATTR_START_NODE = "start_node"
+ATTR_END_NODE = "end_node"
+NO_NODE = -1
+
+def node_index(node_id: str) -> int:
+    return int(node_id) if node_id.isdigit() else NO_NODE
+
+def node_str(index: int) -> str:
+    return str(index) if index != NO_NODE else ""
+
+class BlenderFrameEdge:
+    """
+    Frame living as one edge of a FrameStore mesh (FrameStorage.EDGES).
+    Same read API as BlenderFrame; `obj` is the store object.
+    """
+    __slots__ = ("obj", "_index", "_frame_index")
+
+    TYPE = DomainKind.FRAME
+
+    def __init__(
+        self, store: bpy.types.Object, index: int, frame_index: int | None = None
+    ):
+        if (
+            not hasattr(store, "frame_rna")
+            or store.frame_rna.frame_type != DomainKind.FRAME_STORE
+        ):
+            raise TypeError("Object is not a Frame store")
+
+        self.obj = store
+        self._index = index
+        self._frame_index = (
+            self._attr(ATTR_FRAME_ID, index) if frame_index is None else frame_index
+        )
+
+    def _attr(self, name: str, index: int) -> int:
+        return self.obj.data.attributes[name].data[index].value
+
+    # --- edge index (re-resolved if the store was compacted) ---
+
+    @property
+    def index(self) -> int:
+        mesh = self.obj.data
+        if (
+            self._index < len(mesh.edges)
+            and self._attr(ATTR_FRAME_ID, self._index) == self._frame_index
+        ):
+            return self._index
+
+        data = mesh.attributes[ATTR_FRAME_ID].data
+        ids = np.empty(len(data), dtype=np.int32)
+        data.foreach_get("value", ids)
+        hits = np.flatnonzero(ids == self._frame_index)
+        if len(hits):
+            self._index = int(hits[0])
+            return self._index
+
+        raise LookupError(f"Frame {self._frame_index} no longer in store")
+
+    # --- identity ---
+
+    @property
+    def id(self) -> str:
+        return str(self._frame_index)
+
+    @property
+    def type(self) -> str:
+        return BlenderFrameEdge.TYPE
+
+    # --- topology ---
+
+    @property
+    def start_node_id(self) -> str:
+        return node_str(self._attr(ATTR_START_NODE, self.index))
+
+    @property
+    def end_node_id(self) -> str:
+        return node_str(self._attr(ATTR_END_NODE, self.index))
+
+    # --- geometry ---
+
+    @property
+    def mesh(self) -> bpy.types.Mesh:
+        return self.obj.data
+
+    def endpoints(self) -> tuple[Vector, Vector]:
+        mesh = self.obj.data
+        mw = self.obj.matrix_world
+        v0, v1 = mesh.edges[self.index].vertices
+        return mw @ mesh.vertices[v0].co, mw @ mesh.vertices[v1].co
+
     # --- selection ---
 
     def select(self, context):
@@ -51,6 +183,14 @@ class BlenderFrame:
         self.obj.select_set(True)
         context.view_layer.objects.active = self.obj
 
+        mesh = self.obj.data
+        edge = mesh.edges[self.index]
+        mesh.edges.foreach_set("select", [False] * len(mesh.edges))
+        mesh.vertices.foreach_set("select", [False] * len(mesh.vertices))
+        edge.select = True
+        for v in edge.vertices:
+            mesh.vertices[v].select = True
+
 class FrameRNA(bpy.types.PropertyGroup):
     frame_id: bpy.props.StringProperty(name="Frame ID") # type: ignore
     frame_type: bpy.props.StringProperty(name="Frame Type") # type: ignore
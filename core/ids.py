@@ -0,0 +1,8 @@
+# blender_adapter/core/ids.py
+
+import bpy
+
+class IdCounterRNA(bpy.types.PropertyGroup):
+    # High-water marks: last index handed out per domain kind
+    node_last: bpy.props.IntProperty(name="Last Node Index", min=0) # type: ignore
+    frame_last: bpy.props.IntProperty(name="Last Frame Index", min=0) # type: ignore
@@ -2,6 +2,8 @@ import bpy
 from blender_adapter.core.base import DomainKind
 
 class BlenderNode:
+    __slots__ = ("obj",)
+
     TYPE = DomainKind.NODE
 
     def __init__(self, obj: bpy.types.Object):
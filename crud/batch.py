@@ -0,0 +1,97 @@
+# blender_adapter/crud/batch.py
+
+from typing import NamedTuple
+
+import bpy
+import numpy as np
+
+
+class BatchResult(NamedTuple):
+    """
+    `objects` follows `ids` one to one, except for store frames
+    (FrameStorage.EDGES): every frame lives in its collection's store,
+    so `objects` is just that store, once.
+    """
+    ids: np.ndarray                   # int64 domain indices
+    objects: list[bpy.types.Object]   # same order as ids (see above)
+
+
+def as_vectors(values, dtype=np.float32) -> np.ndarray:
+    """
+    Anything vector-like → contiguous (N, 3) array.
+    """
+    return np.ascontiguousarray(values, dtype=dtype).reshape(-1, 3)
+
+
+def set_tail(prop_collection, attr: str, values, dtype=np.float32):
+    """
+    foreach_set `attr` on the LAST len(values) items of a prop collection.
+
+    collection.objects keeps link order, so freshly linked objects are
+    always the tail. foreach_* only works on whole collections, so read
+    everything, patch the tail, write everything back — still one C
+    pass each way instead of one RNA call per item.
+    """
+    values = np.asarray(values, dtype=dtype)
+    n_new = len(values)
+    if n_new == 0:
+        return
+
+    width = values.size // n_new
+    total = len(prop_collection)
+
+    buf = np.empty(total * width, dtype=dtype)
+    prop_collection.foreach_get(attr, buf)
+    buf[(total - n_new) * width:] = values.ravel()
+    prop_collection.foreach_set(attr, buf)
+
+
+def link_many(collection, objs):
+    link = collection.objects.link
+    for obj in objs:
+        link(obj)
+
+
+def get_all(prop_collection, attr: str, width: int = 1, dtype=np.float32):
+    """
+    foreach_get `attr` over the whole collection → (N,) or (N, width).
+    """
+    buf = np.empty(len(prop_collection) * width, dtype=dtype)
+    prop_collection.foreach_get(attr, buf)
+    return buf if width == 1 else buf.reshape(-1, width)
+
+
+def offset_locations(objs, delta, source=None):
+    """
+    Add `delta` to the location of every object in `objs` with one
+    foreach_get / foreach_set over `source` (defaults to the view-layer
+    selection, which is what the transform operators act on).
+
+    foreach_set skips RNA update callbacks, so each object is tagged
+    for re-evaluation explicitly afterwards.
+    """
+    objs = list(objs)
+    if not objs:
+        return
+
+    if source is None:
+        source = bpy.context.view_layer.objects.selected
+
+    ptrs = {obj.as_pointer() for obj in objs}
+    mask = np.fromiter(
+        (obj.as_pointer() in ptrs for obj in source), dtype=bool
+    )
+
+    if mask.sum() != len(ptrs):
+        # some targets are not part of `source` → plain per-object path
+        offset = np.asarray(delta, dtype=np.float64)
+        for obj in objs:
+            obj.location = np.asarray(obj.location) + offset
+        return
+
+    locations = get_all(source, "location", 3)
+    locations[mask] += np.asarray(delta, dtype=np.float32)
+    source.foreach_set("location", locations.ravel())
+
+    for obj in objs:
+        obj.update_tag(refresh={'OBJECT'})
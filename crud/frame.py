@@ -1,22 +1,53 @@
 # blender_adapter/crud/frame.py
 
+from collections.abc import Iterator
+
 import bpy
-from blender_adapter.core.frame import BlenderFrame
-from mathutils import Vector
+import numpy as np
+from blender_adapter.core.frame import (
+    BlenderFrame,
+    BlenderFrameEdge,
+    UNIT_MESH_FLAG,
+    node_index,
+)
+from blender_adapter.core.base import DomainKind, FrameStorage
+from blender_adapter.crud.batch import (
+    BatchResult,
+    link_many,
+    offset_locations,
+    set_tail,
+)
+from blender_adapter.crud.frame_store import FrameEdgeStore
+from blender_adapter.utils.geometry import centroid, local_vertices
+from blender_adapter.service.id_allocator import id_allocator
+from blender_adapter.service.registry import classify, domain_registry
+from blender_adapter.service.wrappers import wrapper_cache
+from mathutils import Matrix, Vector
+
+AnyFrame = BlenderFrame | BlenderFrameEdge
+
+UNIT_MESH_NAME = "SoM_UnitFrame"
+MIN_LENGTH = 1e-6   # unit-frame X scale floor (zero-length frames)
 
 class BlenderFrameAdapter:
 
+    _unit_mesh: bpy.types.Mesh | None = None   # see unit_mesh()
+
+    # ---------- STORAGE ----------
+    @staticmethod
+    def storage(scene=None) -> str:
+        scene = scene or bpy.context.scene
+        model = getattr(scene, "som_model", None)
+        return model.frame_storage if model else FrameStorage.OBJECT
+
     # ---------- ID ----------
     @staticmethod
-    def next_id(prefix="F"):
-        max_index = 0
-        for obj in bpy.data.objects:
-            if obj.name.startswith(prefix):
-                suffix = obj.name[len(prefix):]
-                if suffix.isdigit():
-                    max_index = max(max_index, int(suffix))
-        idx = max_index + 1
-        return str(idx), f"{prefix}{idx}"
+    def next_id():
+        return id_allocator.next_id(DomainKind.FRAME)
+
+    @staticmethod
+    def reserve_ids(count: int) -> list[tuple[str, str]]:
+        return id_allocator.reserve(DomainKind.FRAME, count)
 
     # ---------- CREATE ----------
     @staticmethod
@@ -27,21 +58,38 @@ class BlenderFrameAdapter:
         start_node_id: str,
         end_node_id: str,
         collection=None,
-    ) -> BlenderFrame:
+    ) -> AnyFrame:
 
         if collection is None:
             collection = bpy.context.scene.collection
 
-        frame_id, name = BlenderFrameAdapter.next_id("F")
-
-        mesh = bpy.data.meshes.new(f"{name}_Mesh")
-        mesh.from_pydata([start, end], [(0, 1)], [])
-        mesh.update()
-
-        obj = bpy.data.objects.new(name, mesh)
-        collection.objects.link(obj)
-
-        BlenderFrameAdapter._center_geometry(obj)
+        frame_id, name = BlenderFrameAdapter.next_id()
+
+        if BlenderFrameAdapter.storage() == FrameStorage.EDGES:
+            store = FrameEdgeStore.for_collection(collection, create=True)
+            (index,) = FrameEdgeStore.append(
+                store,
+                [start],
+                [end],
+                int(frame_id),
+                node_index(start_node_id),
+                node_index(end_node_id),
+            )
+            return wrapper_cache.edge(store, index, int(frame_id))
+
+        if BlenderFrameAdapter.storage() == FrameStorage.SHARED:
+            obj = bpy.data.objects.new(name, BlenderFrameAdapter.unit_mesh())
+            obj.matrix_world = BlenderFrameAdapter.segment_matrix(start, end)
+            collection.objects.link(obj)
+        else:
+            mesh = bpy.data.meshes.new(f"{name}_Mesh")
+            mesh.from_pydata([start, end], [(0, 1)], [])
+            mesh.update()
+
+            obj = bpy.data.objects.new(name, mesh)
+            collection.objects.link(obj)
+
+            BlenderFrameAdapter._center_geometry(obj)
 
         rna = obj.frame_rna
         rna.frame_id = frame_id
@@ -50,53 +98,277 @@ class BlenderFrameAdapter:
         rna.end_node = end_node_id
         rna.label = name
 
+        domain_registry.add(obj)
+
         return BlenderFrame(obj)
 
+    @staticmethod
+    def create_many(
+        starts,
+        ends,
+        *,
+        start_node_ids,
+        end_node_ids,
+        collection=None,
+        indices=None,
+    ) -> BatchResult:
+        """
+        Bulk create N frames from (N, 3) world start / end points in the
+        current storage mode. IDs come from one reserved block (or
+        `indices`); node IDs are one string per frame.
+        EDGES: one FrameEdgeStore.append, `objects` is [store] (see
+        BatchResult); SHARED / OBJECT: one object per frame, locations
+        written with a single foreach_set.
+        """
+        if collection is None:
+            collection = bpy.context.scene.collection
+
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        n = len(starts)
+        if indices is None:
+            indices = id_allocator.reserve_range(DomainKind.FRAME, n)
+        ids = np.asarray(indices, dtype=np.int64)
+        if n == 0:
+            return BatchResult(ids, [])
+
+        storage = BlenderFrameAdapter.storage()
+
+        if storage == FrameStorage.EDGES:
+            store = FrameEdgeStore.for_collection(collection, create=True)
+            FrameEdgeStore.append(
+                store,
+                starts,
+                ends,
+                ids,
+                [node_index(n_id) for n_id in start_node_ids],
+                [node_index(n_id) for n_id in end_node_ids],
+            )
+            return BatchResult(ids, [store])
+
+        prefix = id_allocator.PREFIXES[DomainKind.FRAME]
+        mids = (starts + ends) * 0.5
+        new_object = bpy.data.objects.new
+        objs = []
+
+        if storage == FrameStorage.SHARED:
+            unit = BlenderFrameAdapter.unit_mesh()
+            segment_matrix = BlenderFrameAdapter.segment_matrix
+
+        for i, idx in enumerate(map(int, ids)):
+            name = f"{prefix}{idx}"
+
+            if storage == FrameStorage.SHARED:
+                obj = new_object(name, unit)
+                obj.matrix_world = segment_matrix(starts[i], ends[i])
+            else:
+                # vertices centred on the origin, origin at the midpoint
+                mesh = bpy.data.meshes.new(f"{name}_Mesh")
+                mesh.vertices.add(2)
+                mesh.edges.add(1)
+                co = np.stack([starts[i], ends[i]]) - mids[i]
+                mesh.vertices.foreach_set("co", co.ravel())
+                mesh.edges.foreach_set("vertices", (0, 1))
+                mesh.update()
+                obj = new_object(name, mesh)
+
+            rna = obj.frame_rna
+            rna.frame_id = str(idx)
+            rna.frame_type = BlenderFrame.TYPE   # 🔒 enforced
+            rna.start_node = start_node_ids[i]
+            rna.end_node = end_node_ids[i]
+            rna.label = name
+
+            objs.append(obj)
+
+        link_many(collection, objs)
+
+        if storage != FrameStorage.SHARED:
+            set_tail(collection.objects, "location", mids)
+
+        domain_registry.add_many(objs)
+
+        return BatchResult(ids, objs)
+
     # ---------- GEOMETRY ----------
+    @staticmethod
+    def unit_mesh() -> bpy.types.Mesh:
+        """
+        The one 2-vertex mesh shared by every FrameStorage.SHARED frame.
+        Found by UNIT_MESH_FLAG (renaming it does not fork it) and cached.
+        """
+        mesh = BlenderFrameAdapter._unit_mesh
+        try:
+            if mesh is not None and mesh.get(UNIT_MESH_FLAG):
+                return mesh
+        except ReferenceError:
+            pass   # removed, or freed by undo / load
+
+        mesh = next(
+            (
+                m for m in bpy.data.meshes
+                if m.get(UNIT_MESH_FLAG) and len(m.vertices) == 2
+            ),
+            None,
+        )
+        if mesh is None:
+            mesh = bpy.data.meshes.new(UNIT_MESH_NAME)
+            mesh.from_pydata([(-0.5, 0, 0), (0.5, 0, 0)], [(0, 1)], [])
+            mesh.update()
+            mesh[UNIT_MESH_FLAG] = True
+            mesh.use_fake_user = True
+
+        BlenderFrameAdapter._unit_mesh = mesh
+        return mesh
+
+    @staticmethod
+    def segment_matrix(start, end) -> Matrix:
+        """
+        Transform mapping the unit segment onto start → end:
+        origin at the midpoint, local X along the member, X scale = length.
+        Lengths are clamped to MIN_LENGTH so the matrix stays invertible.
+        """
+        start = Vector(start)
+        end = Vector(end)
+        axis = end - start
+
+        rotation = (
+            axis.to_track_quat('X', 'Z')
+            if axis.length > 0.0
+            else Matrix.Identity(3).to_quaternion()
+        )
+        return Matrix.LocRotScale(
+            (start + end) * 0.5,
+            rotation,
+            (max(axis.length, MIN_LENGTH), 1.0, 1.0),
+        )
+
     @staticmethod
     def _center_geometry(obj):
         mesh = obj.data
         if not mesh.vertices:
             return
 
-        center = Vector()
-        for v in mesh.vertices:
-            center += v.co
-        center /= len(mesh.vertices)
+        co = local_vertices(mesh)
+        center = centroid(co)
 
-        for v in mesh.vertices:
-            v.co -= center
+        mesh.vertices.foreach_set(
+            "co", np.ascontiguousarray(co - center, dtype=np.float32).ravel()
+        )
+        mesh.update()
 
-        obj.location += obj.matrix_world.to_3x3() @ center
+        obj.location += obj.matrix_world.to_3x3() @ Vector(center)
 
     # ---------- MOVE ----------
     @staticmethod
-    def move(frame: BlenderFrame, direction):
+    def move(frame: AnyFrame, direction):
+        if isinstance(frame, BlenderFrameEdge):
+            FrameEdgeStore.translate(frame.obj, [frame.index], direction)
+            return
+
         frame.obj.location += Vector(direction)
 
+    @staticmethod
+    def move_many(frames: list[AnyFrame], direction):
+        objs = []
+        by_store: dict[str, tuple[bpy.types.Object, list[int]]] = {}
+
+        for frame in frames:
+            if isinstance(frame, BlenderFrameEdge):
+                _store, indices = by_store.setdefault(
+                    frame.obj.name, (frame.obj, [])
+                )
+                indices.append(frame.index)
+            else:
+                objs.append(frame.obj)
+
+        for store, indices in by_store.values():
+            FrameEdgeStore.translate(store, indices, direction)
+
+        offset_locations(objs, direction)
+
     # ---------- DELETE ----------
     @staticmethod
-    def delete(frame: BlenderFrame):
-        bpy.data.objects.remove(frame.obj, do_unlink=True)
+    def delete(frame: AnyFrame):
+        BlenderFrameAdapter.delete_many([frame])
+
+    @staticmethod
+    def delete_many(frames: list[AnyFrame]):
+        """
+        Remove frames and the meshes they own in one batch_remove pass.
+        Store frames are dropped with one compaction per store.
+        """
+        objs = []
+        meshes = set()
+        by_store: dict[str, tuple[bpy.types.Object, list[int]]] = {}
+
+        for frame in frames:
+            if isinstance(frame, BlenderFrameEdge):
+                _store, indices = by_store.setdefault(
+                    frame.obj.name, (frame.obj, [])
+                )
+                indices.append(frame.index)
+                continue
+
+            objs.append(frame.obj)
+            mesh = frame.obj.data
+            # owned = only this object uses it (never the shared unit mesh)
+            if mesh is not None and mesh.users == 1 and not frame.is_unit:
+                meshes.add(mesh)
+
+        for store, indices in by_store.values():
+            FrameEdgeStore.remove(store, indices)
+            wrapper_cache.discard(store)   # removed frames' wrappers
+
+        if objs:
+            domain_registry.discard_many(objs)
+            # pointers may be reused by a create before the next depsgraph
+            # update
+            for obj in objs:
+                wrapper_cache.discard(obj)
+            bpy.data.batch_remove(objs + list(meshes))
 
     # ---------- REPLICATE ----------
     @staticmethod
     def replicate(
-        frame: BlenderFrame,
+        frame: AnyFrame,
         *,
         direction=(0, 0, 0),
         collection=None,
-    ) -> BlenderFrame:
+        ident: tuple[str, str] | None = None,
+        start_node_id: str | None = None,
+        end_node_id: str | None = None,
+    ) -> AnyFrame:
+        """
+        Copy `frame` offset by `direction`. Node references are copied
+        from the source unless `start_node_id` / `end_node_id` are given
+        (remapped onto replicated nodes, see crud.topology.NodeRemap).
+        """
+        if start_node_id is None:
+            start_node_id = frame.start_node_id
+        if end_node_id is None:
+            end_node_id = frame.end_node_id
+
+        if isinstance(frame, BlenderFrameEdge):
+            return BlenderFrameAdapter._replicate_edge(
+                frame,
+                direction=direction,
+                ident=ident,
+                start_node_id=start_node_id,
+                end_node_id=end_node_id,
+            )
 
         src = frame.obj
 
         if collection is None:
             collection = src.users_collection[0]
 
-        frame_id, name = BlenderFrameAdapter.next_id("F")
+        # ident: pre-reserved (id, name) from reserve_ids()
+        frame_id, name = ident or BlenderFrameAdapter.next_id()
 
         new_obj = src.copy()
-        new_obj.data = src.data.copy()
+        if not frame.is_unit:
+            new_obj.data = src.data.copy()
         new_obj.name = name
         new_obj.location = src.location + Vector(direction)
 
@@ -105,59 +377,137 @@ class BlenderFrameAdapter:
         rna = new_obj.frame_rna
         rna.frame_id = frame_id
         rna.frame_type = BlenderFrame.TYPE   # 🔒 enforced
-        rna.start_node = src.frame_rna.start_node
-        rna.end_node = src.frame_rna.end_node
+        rna.start_node = start_node_id
+        rna.end_node = end_node_id
         rna.label = name
 
+        domain_registry.add(new_obj)
+
         return BlenderFrame(new_obj)
 
+    @staticmethod
+    def _replicate_edge(
+        frame: BlenderFrameEdge,
+        *,
+        direction,
+        ident,
+        start_node_id: str,
+        end_node_id: str,
+    ):
+        (copy,) = BlenderFrameAdapter.replicate_edges(
+            [frame],
+            [direction],
+            idents=[ident or BlenderFrameAdapter.next_id()],
+            start_node_ids=[[start_node_id]],
+            end_node_ids=[[end_node_id]],
+        )
+        return copy
+
+    @staticmethod
+    def replicate_edges(
+        frames: list[BlenderFrameEdge],
+        offsets,
+        *,
+        idents: list[tuple[str, str]],
+        start_node_ids,
+        end_node_ids,
+    ) -> list[BlenderFrameEdge]:
+        """
+        K copies of F store frames, copy `i` offset by `offsets[i]`.
+        `idents` are K * F pre-reserved (id, name) pairs, copy-major;
+        node references are (K, F). Each store is read once and written
+        with one FrameEdgeStore.append, whatever K and F are.
+        """
+        offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 3)
+        k, f = len(offsets), len(frames)
+        frame_ids = np.asarray(
+            [int(frame_id) for frame_id, _name in idents], dtype=np.int64
+        ).reshape(k, f)
+        start_nodes = np.asarray(start_node_ids, dtype=object).reshape(k, f)
+        end_nodes = np.asarray(end_node_ids, dtype=object).reshape(k, f)
+
+        groups: dict[int, tuple[bpy.types.Object, list[int]]] = {}
+        for j, frame in enumerate(frames):
+            groups.setdefault(frame.obj.as_pointer(), (frame.obj, []))[1].append(j)
+
+        copies = []
+        for store, cols in groups.values():
+            edges = [frames[j].index for j in cols]
+            segs = FrameEdgeStore.segments(store)[edges]   # (G, 2, 3)
+
+            indices = FrameEdgeStore.append(
+                store,
+                (segs[None, :, 0] + offsets[:, None]).reshape(-1, 3),
+                (segs[None, :, 1] + offsets[:, None]).reshape(-1, 3),
+                frame_ids[:, cols].ravel(),
+                [node_index(n) for n in start_nodes[:, cols].ravel()],
+                [node_index(n) for n in end_nodes[:, cols].ravel()],
+            )
+            copies.extend(
+                wrapper_cache.edge(store, i, int(frame_index))
+                for i, frame_index in zip(indices, frame_ids[:, cols].ravel())
+            )
+
+        return copies
+
     # ---------- READ (single) ----------
 
     @staticmethod
-    def get_by_id(frame_id: str) -> BlenderFrame | None:
-        for obj in bpy.data.objects:
-            if (
-                hasattr(obj, "frame_rna")
-                and obj.frame_rna.frame_type == BlenderFrame.TYPE
-                and obj.frame_rna.frame_id == frame_id
-            ):
-                return BlenderFrame(obj)
+    def get_by_id(frame_id: str) -> AnyFrame | None:
+        obj = domain_registry.get(DomainKind.FRAME, frame_id)
+        if obj:
+            return wrapper_cache.get(obj, BlenderFrame)
+
+        entry = domain_registry.edge(frame_id)
+        if entry is not None:
+            store, index = entry
+            return wrapper_cache.edge(store, index, int(frame_id))
+
         return None
 
     @staticmethod
     def get_by_object(obj: bpy.types.Object) -> BlenderFrame | None:
-        try:
-            return BlenderFrame(obj)
-        except TypeError:
-            return None
+        return wrapper_cache.get(obj, BlenderFrame)
 
     # ---------- READ (collection) ----------
 
     @staticmethod
-    def all() -> list[BlenderFrame]:
-        result: list[BlenderFrame] = []
+    def iter_all() -> Iterator[AnyFrame]:
+        for obj in domain_registry.objects(DomainKind.FRAME):
+            frame = wrapper_cache.get(obj, BlenderFrame)
+            if frame is not None:
+                yield frame
 
-        for obj in bpy.data.objects:
-            if (
-                hasattr(obj, "frame_rna")
-                and obj.frame_rna.frame_type == BlenderFrame.TYPE
-            ):
-                result.append(BlenderFrame(obj))
-
-        return result
+        for store in FrameEdgeStore.stores():
+            yield from FrameEdgeStore.iter_frames(store)
 
     @staticmethod
-    def selected(context) -> list[BlenderFrame]:
-        result: list[BlenderFrame] = []
+    def all() -> list[AnyFrame]:
+        return list(BlenderFrameAdapter.iter_all())
 
+    @staticmethod
+    def iter_selected(context) -> Iterator[AnyFrame]:
+        # read live: select_set() from scripts is not seen by the
+        # selection cache until the next depsgraph update
+        stores = []
         for obj in context.selected_objects:
-            if (
-                hasattr(obj, "frame_rna")
-                and obj.frame_rna.frame_type == BlenderFrame.TYPE
-            ):
-                result.append(BlenderFrame(obj))
+            key = classify(obj)
+            if key is None:
+                continue
+            if key[0] == DomainKind.FRAME:
+                frame = wrapper_cache.get(obj, BlenderFrame)
+                if frame is not None:
+                    yield frame
+            elif key[0] == DomainKind.FRAME_STORE:
+                stores.append(obj)
+
+        for store in stores:
+            # edge selection flags survive leaving Edit Mode
+            yield from FrameEdgeStore.iter_selected_frames(store)
 
-        return result
+    @staticmethod
+    def selected(context) -> list[AnyFrame]:
+        return list(BlenderFrameAdapter.iter_selected(context))
 
     # ---------- QUERY ----------
 
@@ -0,0 +1,195 @@
+# blender_adapter/crud/frame_store.py
+
+from collections.abc import Iterator
+
+import bpy
+import numpy as np
+
+from blender_adapter.core.base import DomainKind
+from blender_adapter.core.frame import (
+    ATTR_FRAME_ID,
+    ATTR_START_NODE,
+    ATTR_END_NODE,
+    BlenderFrameEdge,
+)
+from blender_adapter.crud.batch import get_all, set_tail
+from blender_adapter.utils.geometry import transform_points
+from blender_adapter.service.registry import domain_registry
+from blender_adapter.service.wrappers import wrapper_cache
+
+ATTRS = (ATTR_FRAME_ID, ATTR_START_NODE, ATTR_END_NODE)
+
+
+class FrameEdgeStore:
+    """
+    FrameStorage.EDGES backend: every frame of a collection is one edge
+    (with its own two vertices) of a single mesh object. Frame ID and
+    node IDs are integer EDGE attributes, so there is one object and one
+    mesh per collection instead of one of each per member.
+    """
+
+    # ---------- STORE ----------
+
+    @staticmethod
+    def is_store(obj) -> bool:
+        rna = getattr(obj, "frame_rna", None)
+        return rna is not None and rna.frame_type == DomainKind.FRAME_STORE
+
+    @staticmethod
+    def stores() -> list[bpy.types.Object]:
+        return domain_registry.objects(DomainKind.FRAME_STORE)
+
+    @staticmethod
+    def for_collection(collection, create: bool = False):
+        for store in FrameEdgeStore.stores():
+            if collection in store.users_collection:
+                return store
+
+        if not create:
+            return None
+
+        name = f"{collection.name}_Frames"
+        mesh = bpy.data.meshes.new(f"{name}_Mesh")
+        FrameEdgeStore._ensure_attributes(mesh)
+
+        store = bpy.data.objects.new(name, mesh)
+        collection.objects.link(store)
+
+        rna = store.frame_rna
+        rna.frame_type = DomainKind.FRAME_STORE   # 🔒 enforced
+        rna.label = name
+
+        domain_registry.add(store)
+        return store
+
+    @staticmethod
+    def _ensure_attributes(mesh):
+        for name in ATTRS:
+            if name not in mesh.attributes:
+                mesh.attributes.new(name=name, type='INT', domain='EDGE')
+
+    # ---------- READ ----------
+
+    @staticmethod
+    def frame_ids(store) -> np.ndarray:
+        data = store.data.attributes[ATTR_FRAME_ID].data
+        return get_all(data, "value", dtype=np.int32)
+
+    @staticmethod
+    def iter_frames(store) -> Iterator[BlenderFrameEdge]:
+        ids = FrameEdgeStore.frame_ids(store).tolist()
+        for i, frame_index in enumerate(ids):
+            yield wrapper_cache.edge(store, i, frame_index)
+
+    @staticmethod
+    def iter_selected_frames(store) -> Iterator[BlenderFrameEdge]:
+        mask = get_all(store.data.edges, "select", dtype=bool)
+        ids = FrameEdgeStore.frame_ids(store)
+        for i in np.flatnonzero(mask).tolist():
+            yield wrapper_cache.edge(store, i, int(ids[i]))
+
+    @staticmethod
+    def segments(store) -> np.ndarray:
+        """
+        World-space (E, 2, 3) start/end points of every frame edge.
+        """
+        mesh = store.data
+        co = get_all(mesh.vertices, "co", 3)
+        ev = get_all(mesh.edges, "vertices", 2, dtype=np.int32)
+        world = transform_points(store.matrix_world, co)
+        return world[ev]
+
+    # ---------- WRITE ----------
+
+    @staticmethod
+    def append(store, starts, ends, frame_ids, start_nodes, end_nodes) -> range:
+        """
+        Append N frames (world-space endpoints) in one pass.
+        Returns the new edge indices.
+        """
+        mesh = store.data
+        starts = np.asarray(starts, dtype=np.float64).reshape(-1, 3)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 3)
+        n = len(starts)
+        if n == 0:
+            return range(0)
+
+        inv = np.linalg.inv(np.asarray(store.matrix_world, dtype=np.float64))
+        co = np.empty((2 * n, 3))
+        co[0::2] = transform_points(inv, starts)
+        co[1::2] = transform_points(inv, ends)
+
+        v0 = len(mesh.vertices)
+        e0 = len(mesh.edges)
+
+        mesh.vertices.add(2 * n)
+        mesh.edges.add(n)
+
+        set_tail(mesh.vertices, "co", co)
+        set_tail(
+            mesh.edges,
+            "vertices",
+            np.arange(v0, v0 + 2 * n).reshape(n, 2),
+            dtype=np.int32,
+        )
+
+        FrameEdgeStore._ensure_attributes(mesh)
+        for name, values in zip(ATTRS, (frame_ids, start_nodes, end_nodes)):
+            set_tail(
+                mesh.attributes[name].data,
+                "value",
+                np.broadcast_to(np.asarray(values, dtype=np.int32), (n,)),
+                dtype=np.int32,
+            )
+
+        mesh.update()
+        domain_registry.add(store)   # new frame ids → edge index
+        return range(e0, e0 + n)
+
+    @staticmethod
+    def translate(store, edge_indices, direction):
+        mesh = store.data
+        co = get_all(mesh.vertices, "co", 3)
+        ev = get_all(mesh.edges, "vertices", 2, dtype=np.int32)
+
+        # direction is world-space → store-local
+        m = np.asarray(store.matrix_world, dtype=np.float64)
+        local = np.linalg.solve(m[:3, :3], np.asarray(direction, dtype=np.float64))
+
+        co[np.unique(ev[np.asarray(edge_indices, dtype=np.int64)])] += local
+        mesh.vertices.foreach_set("co", co.ravel())
+        mesh.update()
+
+    @staticmethod
+    def remove(store, edge_indices):
+        """
+        Drop edges (and the vertices they own) and compact the mesh.
+        """
+        mesh = store.data
+        co = get_all(mesh.vertices, "co", 3)
+        ev = get_all(mesh.edges, "vertices", 2, dtype=np.int32)
+        attrs = {
+            name: get_all(mesh.attributes[name].data, "value", dtype=np.int32)
+            for name in ATTRS
+        }
+
+        keep = np.ones(len(ev), dtype=bool)
+        keep[np.asarray(edge_indices, dtype=np.int64)] = False
+
+        ev = ev[keep]
+        used = np.unique(ev)
+        remap = np.full(len(co), -1, dtype=np.int32)
+        remap[used] = np.arange(len(used), dtype=np.int32)
+
+        mesh.clear_geometry()
+        FrameEdgeStore._ensure_attributes(mesh)
+
+        mesh.vertices.add(len(used))
+        mesh.edges.add(len(ev))
+        mesh.vertices.foreach_set("co", co[used].ravel())
+        mesh.edges.foreach_set("vertices", remap[ev].ravel())
+        for name, values in attrs.items():
+            mesh.attributes[name].data.foreach_set("value", values[keep])
+
+        mesh.update()
+        domain_registry.add(store)   # edge indices shifted
@@ -1,22 +1,33 @@
 # blender_adapter/crud/node.py
 
+from collections.abc import Iterator
+
 import bpy
+import numpy as np
 from mathutils import Vector
 from blender_adapter.core.node import BlenderNode
+from blender_adapter.core.base import DomainKind
+from blender_adapter.service.id_allocator import id_allocator
+from blender_adapter.service.registry import domain_registry
+from blender_adapter.service.wrappers import wrapper_cache
+from blender_adapter.crud.batch import (
+    BatchResult,
+    as_vectors,
+    link_many,
+    offset_locations,
+    set_tail,
+)
 
 class BlenderNodeAdapter:
 
     # ---------- ID ----------
     @staticmethod
-    def next_id(prefix="N"):
-        max_index = 0
-        for obj in bpy.data.objects:
-            if obj.name.startswith(prefix):
-                suffix = obj.name[len(prefix):]
-                if suffix.isdigit():
-                    max_index = max(max_index, int(suffix))
-        idx = max_index + 1
-        return str(idx), f"{prefix}{idx}"
+    def next_id():
+        return id_allocator.next_id(DomainKind.NODE)
+
+    @staticmethod
+    def reserve_ids(count: int) -> list[tuple[str, str]]:
+        return id_allocator.reserve(DomainKind.NODE, count)
 
     # ---------- CREATE ----------
     @staticmethod
@@ -30,7 +41,7 @@ class BlenderNodeAdapter:
         if collection is None:
             collection = bpy.context.scene.collection
 
-        node_id, name = BlenderNodeAdapter.next_id("N")
+        node_id, name = BlenderNodeAdapter.next_id()
 
         obj = bpy.data.objects.new(name, None)
         obj.empty_display_type = 'PLAIN_AXES'
@@ -43,13 +54,78 @@ class BlenderNodeAdapter:
         rna.node_type = BlenderNode.TYPE   # 🔒 enforced
         rna.label = name
 
+        domain_registry.add(obj)
+
         return BlenderNode(obj)
 
+    @staticmethod
+    def create_many(
+        locations,
+        *,
+        size=0.5,
+        display_type='PLAIN_AXES',
+        collection=None,
+        indices=None,
+    ) -> BatchResult:
+        """
+        Bulk create from an (N, 3) array of locations.
+        IDs come from one reserved block (or `indices`, a slice of a block
+        the caller reserved); transforms are written with foreach_set
+        instead of per-object assignment. `size` and `display_type` are
+        scalars or per node.
+        """
+        if collection is None:
+            collection = bpy.context.scene.collection
+
+        locations = as_vectors(locations)
+        if indices is None:
+            indices = id_allocator.reserve_range(
+                DomainKind.NODE, len(locations)
+            )
+        prefix = id_allocator.PREFIXES[DomainKind.NODE]
+
+        # enum: no foreach_set, assigned per object in the loop below
+        display_types = np.broadcast_to(
+            np.asarray(display_type, dtype=object), (len(locations),)
+        )
+
+        new_object = bpy.data.objects.new
+        objs = []
+
+        for idx, display in zip(map(int, indices), display_types):
+            name = f"{prefix}{idx}"
+            obj = new_object(name, None)
+            obj.empty_display_type = display
+
+            rna = obj.node_rna
+            rna.node_id = str(idx)
+            rna.node_type = BlenderNode.TYPE   # 🔒 enforced
+            rna.label = name
+
+            objs.append(obj)
+
+        link_many(collection, objs)
+
+        set_tail(collection.objects, "location", locations)
+        set_tail(
+            collection.objects,
+            "empty_display_size",
+            np.broadcast_to(np.asarray(size, dtype=np.float32), (len(objs),)),
+        )
+
+        domain_registry.add_many(objs)
+
+        return BatchResult(np.asarray(indices, dtype=np.int64), objs)
+
     # ---------- MOVE ----------
     @staticmethod
     def move(node: BlenderNode, direction):
         node.obj.location += Vector(direction)
 
+    @staticmethod
+    def move_many(nodes: list[BlenderNode], direction):
+        offset_locations([node.obj for node in nodes], direction)
+
     # ---------- SET LOCATION (used by drag) ----------
     @staticmethod
     def set_location(node: BlenderNode, location):
@@ -58,7 +134,19 @@ class BlenderNodeAdapter:
     # ---------- DELETE ----------
     @staticmethod
     def delete(node: BlenderNode):
-        bpy.data.objects.remove(node.obj, do_unlink=True)
+        BlenderNodeAdapter.delete_many([node])
+
+    @staticmethod
+    def delete_many(nodes: list[BlenderNode]):
+        objs = [node.obj for node in nodes]
+        if not objs:
+            return
+
+        domain_registry.discard_many(objs)
+        # pointers may be reused by a create before the next depsgraph update
+        for obj in objs:
+            wrapper_cache.discard(obj)
+        bpy.data.batch_remove(objs)
 
     # ---------- REPLICATE ----------
     @staticmethod
@@ -67,6 +155,7 @@ class BlenderNodeAdapter:
         *,
         location=None,
         collection=None,
+        ident: tuple[str, str] | None = None,
     ) -> BlenderNode:
 
         src = node.obj
@@ -77,7 +166,8 @@ class BlenderNodeAdapter:
         if collection is None:
             collection = src.users_collection[0]
 
-        node_id, name = BlenderNodeAdapter.next_id("N")
+        # ident: pre-reserved (id, name) from reserve_ids()
+        node_id, name = ident or BlenderNodeAdapter.next_id()
 
         obj = bpy.data.objects.new(name, None)
         obj.empty_display_type = src.empty_display_type
@@ -90,58 +180,49 @@ class BlenderNodeAdapter:
         rna.node_type = BlenderNode.TYPE   # 🔒 enforced
         rna.label = name
 
+        domain_registry.add(obj)
+
         return BlenderNode(obj)
 
     # ---------- READ (single) ----------
 
     @staticmethod
     def get_by_id(node_id: str) -> BlenderNode | None:
-        for obj in bpy.data.objects:
-            if (
-                hasattr(obj, "node_rna")
-                and obj.node_rna.node_type == BlenderNode.TYPE
-                and obj.node_rna.node_id == node_id
-            ):
-                return BlenderNode(obj)
-        return None
+        obj = domain_registry.get(DomainKind.NODE, node_id)
+        return wrapper_cache.get(obj, BlenderNode) if obj else None
 
     @staticmethod
     def get_by_object(obj: bpy.types.Object) -> BlenderNode | None:
-        try:
-            return BlenderNode(obj)
-        except TypeError:
-            return None
+        return wrapper_cache.get(obj, BlenderNode)
 
     # ---------- READ (collection) ----------
 
     @staticmethod
-    def all() -> list[BlenderNode]:
-        result: list[BlenderNode] = []
-
-        for obj in bpy.data.objects:
-            if (
-                hasattr(obj, "node_rna")
-                and obj.node_rna.node_type == BlenderNode.TYPE
-            ):
-                result.append(BlenderNode(obj))
-
-        return result
+    def iter_all() -> Iterator[BlenderNode]:
+        for obj in domain_registry.objects(DomainKind.NODE):
+            node = wrapper_cache.get(obj, BlenderNode)
+            if node is not None:
+                yield node
 
     @staticmethod
-    def selected(context) -> list[BlenderNode]:
-        result: list[BlenderNode] = []
+    def all() -> list[BlenderNode]:
+        return list(BlenderNodeAdapter.iter_all())
 
+    @staticmethod
+    def iter_selected(context) -> Iterator[BlenderNode]:
+        # read live: select_set() from scripts is not seen by the
+        # selection cache until the next depsgraph update
         for obj in context.selected_objects:
-            if (
-                hasattr(obj, "node_rna")
-                and obj.node_rna.node_type == BlenderNode.TYPE
-            ):
-                result.append(BlenderNode(obj))
+            node = wrapper_cache.get(obj, BlenderNode)
+            if node is not None:
+                yield node
 
-        return result
+    @staticmethod
+    def selected(context) -> list[BlenderNode]:
+        return list(BlenderNodeAdapter.iter_selected(context))
 
     # ---------- QUERY ----------
 
     @staticmethod
     def exists(node_id: str) -> bool:
-        return BlenderNodeAdapter.get_by_id(node_id) is not None
\ No newline at end of file
+        return domain_registry.contains(DomainKind.NODE, node_id)
\ No newline at end of file
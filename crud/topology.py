@@ -0,0 +1,38 @@
+# blender_adapter/crud/topology.py
+
+import numpy as np
+
+
+class NodeRemap:
+    """
+    old → new node IDs for a batch of K copies of N source nodes.
+
+    `new_ids[c, j]` (or the flat copy-major equivalent) is the ID of
+    copy `c` of `source_ids[j]`. Frame node references are resolved
+    against the whole table at once: one dict lookup per frame end, then
+    array indexing for every copy. References to nodes outside the batch
+    are kept as they are.
+    """
+
+    def __init__(self, source_ids, new_ids, copies: int):
+        source_ids = list(source_ids)
+        self._rows = {node_id: j for j, node_id in enumerate(source_ids) if node_id}
+        self._new = np.asarray(new_ids).reshape(copies, len(source_ids))
+
+    def remap(self, refs) -> np.ndarray:
+        """
+        (F,) node references → (K, F) references per copy (str objects).
+        """
+        refs = list(refs)
+        rows = np.fromiter(
+            (self._rows.get(ref, -1) for ref in refs),
+            dtype=np.int64,
+            count=len(refs),
+        )
+        hit = rows >= 0
+
+        out = np.empty((len(self._new), len(refs)), dtype=object)
+        out[:] = np.asarray(refs, dtype=object)
+        if hit.any():
+            out[:, hit] = self._new[:, rows[hit]].astype(str)
+        return out
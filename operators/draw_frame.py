@@ -1,5 +1,6 @@
 import bpy
 from blender_adapter.crud.frame import BlenderFrameAdapter
+from blender_adapter.service.snap_preview import SnapPreview
 from blender_adapter.service.snapping import SnappingService
 from blender_adapter.utils.navigation import is_navigation_event
 
@@ -9,13 +10,36 @@ class DrawFrame(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     snap_threshold: bpy.props.FloatProperty(default=10.0)  # type: ignore
+    snap_reference: bpy.props.BoolProperty(  # type: ignore
+        name="Snap to Reference Meshes",
+        description="Snap to vertex / edge / face of plain meshes under the cursor",
+        default=False,
+    )
+    snap_on_member: bpy.props.BoolProperty(  # type: ignore
+        name="Snap on Member",
+        description="Snap to the nearest point along any frame",
+        default=False,
+    )
+    snap_preview: bpy.props.BoolProperty(  # type: ignore
+        name="Snap Preview",
+        description="Show the snap target while hovering with Shift held",
+        default=True,
+    )
 
     def invoke(self, context, event):
         if context.area.type != 'VIEW_3D':
             self.report({'WARNING'}, "3D View required")
             return {'CANCELLED'}
 
-        self._snapping = SnappingService(self.snap_threshold)
+        self._snapping = SnappingService(
+            self.snap_threshold,
+            snap_reference=self.snap_reference,
+            snap_on_member=self.snap_on_member,
+        )
+        self._snapping.begin_session(context)
+        self._preview = SnapPreview(self._snapping) if self.snap_preview else None
+        if self._preview is not None:
+            self._preview.enable(context)
         self._start_point = None
         self._start_node_id = None
 
@@ -30,9 +54,20 @@ class DrawFrame(bpy.types.Operator):
         if is_navigation_event(event):
             return {'PASS_THROUGH'}
 
+        if self._preview is not None:
+            if event.type == 'MOUSEMOVE':
+                self._preview.update(context, event)
+                return {'RUNNING_MODAL'}
+
+            if event.type in {'LEFT_SHIFT', 'RIGHT_SHIFT'}:
+                self._preview.update(context, event, force=True)
+
         if event.type == 'ESC':
             self._start_point = None
             self._start_node_id = None
+            if self._preview is not None:
+                self._preview.disable()
+            self._snapping.end_session()
             context.area.header_text_set(None)
             return {'CANCELLED'}
 
@@ -55,6 +90,12 @@ class DrawFrame(bpy.types.Operator):
                 collection=context.collection,
             )
             frame.select(context)
+            self._snapping.add_points(
+                [self._start_point, point, (self._start_point + point) * 0.5]
+            )
+            self._snapping.add_segment(self._start_point, point)
+            if self._preview is not None:
+                self._preview.invalidate()
 
             self._start_point = point
             self._start_node_id = "TEMP"
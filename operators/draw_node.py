@@ -2,6 +2,7 @@
 
 import bpy
 from blender_adapter.crud.node import BlenderNodeAdapter
+from blender_adapter.service.snap_preview import SnapPreview
 from blender_adapter.service.snapping import SnappingService
 from blender_adapter.utils.navigation import is_navigation_event
 
@@ -11,6 +12,21 @@ class DrawNode(bpy.types.Operator):
     bl_options = {'REGISTER', 'UNDO'}
 
     snap_threshold: bpy.props.FloatProperty(default=10.0)  # type: ignore
+    snap_reference: bpy.props.BoolProperty(  # type: ignore
+        name="Snap to Reference Meshes",
+        description="Snap to vertex / edge / face of plain meshes under the cursor",
+        default=False,
+    )
+    snap_on_member: bpy.props.BoolProperty(  # type: ignore
+        name="Snap on Member",
+        description="Snap to the nearest point along any frame",
+        default=False,
+    )
+    snap_preview: bpy.props.BoolProperty(  # type: ignore
+        name="Snap Preview",
+        description="Show the snap target while hovering with Shift held",
+        default=True,
+    )
     empty_size: bpy.props.FloatProperty(default=0.1, min=0.001)  # type: ignore
 
     def invoke(self, context, event):
@@ -18,7 +34,15 @@ class DrawNode(bpy.types.Operator):
             self.report({'WARNING'}, "3D View required")
             return {'CANCELLED'}
 
-        self._snapping = SnappingService(self.snap_threshold)
+        self._snapping = SnappingService(
+            self.snap_threshold,
+            snap_reference=self.snap_reference,
+            snap_on_member=self.snap_on_member,
+        )
+        self._snapping.begin_session(context)
+        self._preview = SnapPreview(self._snapping) if self.snap_preview else None
+        if self._preview is not None:
+            self._preview.enable(context)
 
         context.area.header_text_set(
             "Click to place Node | Shift+Click to snap"
@@ -31,7 +55,18 @@ class DrawNode(bpy.types.Operator):
         if is_navigation_event(event):
             return {'PASS_THROUGH'}
 
+        if self._preview is not None:
+            if event.type == 'MOUSEMOVE':
+                self._preview.update(context, event)
+                return {'RUNNING_MODAL'}
+
+            if event.type in {'LEFT_SHIFT', 'RIGHT_SHIFT'}:
+                self._preview.update(context, event, force=True)
+
         if event.type == 'ESC':
+            if self._preview is not None:
+                self._preview.disable()
+            self._snapping.end_session()
             context.area.header_text_set(None)
             return {'CANCELLED'}
 
@@ -44,5 +79,8 @@ class DrawNode(bpy.types.Operator):
                 collection=context.collection,
             )
             node.select(context)
+            self._snapping.add_points([point])
+            if self._preview is not None:
+                self._preview.invalidate()
 
         return {'RUNNING_MODAL'}
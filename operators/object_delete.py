@@ -2,6 +2,7 @@ import bpy
 
 from blender_adapter.crud.node import BlenderNodeAdapter
 from blender_adapter.crud.frame import BlenderFrameAdapter
+from blender_adapter.service.selection import selection_cache
 
 class DeleteObject(bpy.types.Operator):
     bl_idname = "som.delete_object"
@@ -10,26 +11,16 @@ class DeleteObject(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return any(
-            BlenderNodeAdapter.get_by_object(obj)
-            or BlenderFrameAdapter.get_by_object(obj)
-            for obj in context.selected_objects
-        )
+        # cached per selection → O(1) on sidebar redraws
+        return selection_cache.has_domain(context)
 
     def execute(self, context):
         # SNAPSHOT selection (important!)
-        objs = list(context.selected_objects)
+        nodes = BlenderNodeAdapter.selected(context)
+        frames = BlenderFrameAdapter.selected(context)
 
-        for obj in objs:
-
-            node = BlenderNodeAdapter.get_by_object(obj)
-            if node:
-                BlenderNodeAdapter.delete(node)
-                continue
-
-            frame = BlenderFrameAdapter.get_by_object(obj)
-            if frame:
-                BlenderFrameAdapter.delete(frame)
+        BlenderNodeAdapter.delete_many(nodes)
+        BlenderFrameAdapter.delete_many(frames)
 
         return {'FINISHED'}
 
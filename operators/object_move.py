@@ -2,6 +2,7 @@ import bpy
 
 from blender_adapter.crud.node import BlenderNodeAdapter
 from blender_adapter.crud.frame import BlenderFrameAdapter
+from blender_adapter.service.selection import selection_cache
 
 class MoveObject(bpy.types.Operator):
     bl_idname = "som.move_object"
@@ -12,27 +13,30 @@ class MoveObject(bpy.types.Operator):
     dy: bpy.props.FloatProperty(name="ΔY", default=0.0, options={'SKIP_SAVE'})  # type: ignore
     dz: bpy.props.FloatProperty(name="ΔZ", default=0.0, options={'SKIP_SAVE'})  # type: ignore
 
+    BATCH_THRESHOLD = 64
+
     @classmethod
     def poll(cls, context):
-        return any(
-            BlenderNodeAdapter.get_by_object(obj)
-            or BlenderFrameAdapter.get_by_object(obj)
-            for obj in context.selected_objects
-        )
+        # cached per selection → O(1) on sidebar redraws
+        return selection_cache.has_domain(context)
 
     def execute(self, context):
         direction = (self.dx, self.dy, self.dz)
 
         # snapshot selection
-        for obj in list(context.selected_objects):
+        nodes = BlenderNodeAdapter.selected(context)
+        frames = BlenderFrameAdapter.selected(context)
+
+        # large selections → one foreach pass instead of per-object writes
+        if len(nodes) + len(frames) >= self.BATCH_THRESHOLD:
+            BlenderNodeAdapter.move_many(nodes, direction)
+            BlenderFrameAdapter.move_many(frames, direction)
+            return {'FINISHED'}
 
-            node = BlenderNodeAdapter.get_by_object(obj)
-            if node:
-                BlenderNodeAdapter.move(node, direction)
-                continue
+        for node in nodes:
+            BlenderNodeAdapter.move(node, direction)
 
-            frame = BlenderFrameAdapter.get_by_object(obj)
-            if frame:
-                BlenderFrameAdapter.move(frame, direction)
+        for frame in frames:
+            BlenderFrameAdapter.move(frame, direction)
 
         return {'FINISHED'}
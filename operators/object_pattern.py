@@ -0,0 +1,181 @@
+import math
+
+import bpy
+import numpy as np
+
+from blender_adapter.core.base import DomainKind
+from blender_adapter.crud.node import BlenderNodeAdapter
+from blender_adapter.crud.frame import BlenderFrameAdapter
+from blender_adapter.crud.topology import NodeRemap
+from blender_adapter.service.id_allocator import id_allocator
+from blender_adapter.service.selection import selection_cache
+from blender_adapter.utils.geometry import (
+    grid_pattern,
+    linear_pattern,
+    polar_pattern,
+    transform_stack,
+)
+
+class PatternArray(bpy.types.Operator):
+    """Copy the selected nodes and frames along a linear, grid or polar pattern"""
+    bl_idname = "som.pattern_array"
+    bl_label = "Pattern Array"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    pattern: bpy.props.EnumProperty(  # type: ignore
+        name="Pattern",
+        items=(
+            ('LINEAR', "Linear", "Copies at multiples of one offset"),
+            ('GRID', "Grid", "Rectangular X × Y × Z grid"),
+            ('POLAR', "Polar", "Copies rotated about the Z axis"),
+        ),
+        default='LINEAR',
+    )
+
+    count: bpy.props.IntProperty(name="Count", default=3, min=1)  # type: ignore
+    step: bpy.props.FloatVectorProperty(  # type: ignore
+        name="Offset", default=(1.0, 0.0, 0.0), subtype='TRANSLATION'
+    )
+
+    grid_count: bpy.props.IntVectorProperty(  # type: ignore
+        name="Grid", default=(2, 2, 1), min=1, size=3
+    )
+    spacing: bpy.props.FloatVectorProperty(  # type: ignore
+        name="Spacing", default=(1.0, 1.0, 1.0), subtype='TRANSLATION'
+    )
+
+    angle: bpy.props.FloatProperty(  # type: ignore
+        name="Angle", default=math.pi / 2, subtype='ANGLE'
+    )
+    center: bpy.props.FloatVectorProperty(  # type: ignore
+        name="Center", default=(0.0, 0.0, 0.0), subtype='TRANSLATION'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return selection_cache.has_domain(context)
+
+    def draw(self, context):
+        layout = self.layout
+        layout.prop(self, "pattern")
+
+        if self.pattern == 'LINEAR':
+            layout.prop(self, "count")
+            layout.prop(self, "step")
+        elif self.pattern == 'GRID':
+            layout.prop(self, "grid_count")
+            layout.prop(self, "spacing")
+        else:
+            layout.prop(self, "count")
+            layout.prop(self, "angle")
+            layout.prop(self, "center")
+
+    def transforms(self) -> np.ndarray:
+        if self.pattern == 'LINEAR':
+            return linear_pattern(self.step, self.count)
+        if self.pattern == 'GRID':
+            return grid_pattern(self.grid_count, self.spacing)
+        return polar_pattern(self.angle, self.count, self.center)
+
+    def execute(self, context):
+        mats = self.transforms()
+        k = len(mats)
+
+        # SNAPSHOT selection (important!)
+        nodes = BlenderNodeAdapter.selected(context)
+        frames = BlenderFrameAdapter.selected(context)
+
+        ends = [frame.endpoints() for frame in frames]
+        frames = [frame for frame, pair in zip(frames, ends) if pair is not None]
+        ends = [pair for pair in ends if pair is not None]
+
+        if not k or not (nodes or frames):
+            return {'CANCELLED'}
+
+        # One ID block per kind for the whole pattern, copy-major
+        # (breadth-first like ReplicateObject): ids[copy, source]
+        node_ids = np.asarray(
+            id_allocator.reserve_range(DomainKind.NODE, k * len(nodes))
+        ).reshape(k, len(nodes))
+        frame_ids = np.asarray(
+            id_allocator.reserve_range(DomainKind.FRAME, k * len(frames))
+        ).reshape(k, len(frames))
+
+        new_objs = []
+
+        # ----- nodes: one create_many per target collection -----
+        if nodes:
+            locations = np.asarray(
+                [tuple(node.obj.location) for node in nodes], dtype=np.float64
+            )
+            sizes = np.asarray(
+                [node.obj.empty_display_size for node in nodes],
+                dtype=np.float32,
+            )
+            display_types = np.asarray(
+                [node.obj.empty_display_type for node in nodes], dtype=object
+            )
+            targets = transform_stack(mats, locations)   # (k, N, 3)
+
+            for collection, idx in _group_by_collection(nodes):
+                result = BlenderNodeAdapter.create_many(
+                    targets[:, idx].reshape(-1, 3),
+                    size=np.tile(sizes[idx], k),
+                    display_type=np.tile(display_types[idx], k),
+                    collection=collection,
+                    indices=node_ids[:, idx].ravel(),
+                )
+                new_objs.extend(result.objects)
+
+        # ----- frames: one create_many per target collection -----
+        if frames:
+            starts = np.asarray([tuple(e[0]) for e in ends], dtype=np.float64)
+            stops = np.asarray([tuple(e[1]) for e in ends], dtype=np.float64)
+            starts = transform_stack(mats, starts)
+            stops = transform_stack(mats, stops)
+
+            # Copy as a subgraph: frame ends on patterned nodes follow
+            # the copies, (k, F) references from one old → new table
+            remap = NodeRemap([node.id for node in nodes], node_ids, k)
+            start_nodes = remap.remap([frame.start_node_id for frame in frames])
+            end_nodes = remap.remap([frame.end_node_id for frame in frames])
+
+            for collection, idx in _group_by_collection(frames):
+                result = BlenderFrameAdapter.create_many(
+                    starts[:, idx].reshape(-1, 3),
+                    stops[:, idx].reshape(-1, 3),
+                    start_node_ids=start_nodes[:, idx].ravel().tolist(),
+                    end_node_ids=end_nodes[:, idx].ravel().tolist(),
+                    collection=collection,
+                    indices=frame_ids[:, idx].ravel(),
+                )
+                new_objs.extend(result.objects)
+
+        # ----- selection handling -----
+        for obj in new_objs:
+            obj.select_set(True)
+
+        if new_objs:
+            context.view_layer.objects.active = new_objs[-1]
+        selection_cache.invalidate()
+
+        self.report(
+            {'INFO'},
+            f"Pattern: {k * len(nodes)} nodes, {k * len(frames)} frames",
+        )
+        return {'FINISHED'}
+
+
+def _group_by_collection(items):
+    """
+    [(collection, source indices)] keyed on each item's first collection.
+    """
+    groups: dict[str, tuple[bpy.types.Collection, list[int]]] = {}
+    for i, item in enumerate(items):
+        collection = item.obj.users_collection[0]
+        groups.setdefault(collection.name, (collection, []))[1].append(i)
+
+    return [
+        (collection, np.asarray(idx, dtype=np.int64))
+        for collection, idx in groups.values()
+    ]
@@ -2,7 +2,10 @@ import bpy
 from mathutils import Vector
 
 from blender_adapter.crud.node import BlenderNodeAdapter
+from blender_adapter.core.frame import BlenderFrameEdge
 from blender_adapter.crud.frame import BlenderFrameAdapter
+from blender_adapter.crud.topology import NodeRemap
+from blender_adapter.service.selection import selection_cache
 
 class ReplicateObject(bpy.types.Operator):
     bl_idname = "som.replicate_object"
@@ -21,41 +24,79 @@ class ReplicateObject(bpy.types.Operator):
 
     @classmethod
     def poll(cls, context):
-        return any(
-            BlenderNodeAdapter.get_by_object(obj)
-            or BlenderFrameAdapter.get_by_object(obj)
-            for obj in context.selected_objects
-        )
+        # cached per selection → O(1) on sidebar redraws
+        return selection_cache.has_domain(context)
 
     def execute(self, context):
         delta = Vector((self.dx, self.dy, self.dz))
 
         # SNAPSHOT selection (important!)
-        source_objs = list(context.selected_objects)
+        nodes = BlenderNodeAdapter.selected(context)
+        frames = BlenderFrameAdapter.selected(context)
+
+        # Reserve every ID for the whole batch in one call per kind
+        node_idents = BlenderNodeAdapter.reserve_ids(len(nodes) * self.count)
+        node_ids = iter(node_idents)
+        frame_idents = BlenderFrameAdapter.reserve_ids(len(frames) * self.count)
+
+        # Copy as a subgraph: frame ends on replicated nodes follow the
+        # copies (old → new map for every step, built once)
+        remap = NodeRemap(
+            [node.id for node in nodes],
+            [ident for ident, _name in node_idents],
+            self.count,
+        )
+        starts = remap.remap([frame.start_node_id for frame in frames])
+        ends = remap.remap([frame.end_node_id for frame in frames])
+
+        # Store frames are copied in one append per store after the loop
+        edge_cols = [
+            j for j, frame in enumerate(frames)
+            if isinstance(frame, BlenderFrameEdge)
+        ]
+        object_cols = [
+            j for j, frame in enumerate(frames)
+            if not isinstance(frame, BlenderFrameEdge)
+        ]
+
         new_objs = []
 
         # BREADTH-FIRST replication (by step)
         for i in range(1, self.count + 1):
             step_delta = delta * i
 
-            for obj in source_objs:
-
-                node = BlenderNodeAdapter.get_by_object(obj)
-                if node:
-                    new_node = BlenderNodeAdapter.replicate(
-                        node,
-                        location=node.obj.location + step_delta,
-                    )
-                    new_objs.append(new_node.obj)
-                    continue
-
-                frame = BlenderFrameAdapter.get_by_object(obj)
-                if frame:
-                    new_frame = BlenderFrameAdapter.replicate(
-                        frame,
-                        direction=step_delta,
-                    )
-                    new_objs.append(new_frame.obj)
+            for node in nodes:
+                new_node = BlenderNodeAdapter.replicate(
+                    node,
+                    location=node.obj.location + step_delta,
+                    ident=next(node_ids),
+                )
+                new_objs.append(new_node.obj)
+
+            for j in object_cols:
+                new_frame = BlenderFrameAdapter.replicate(
+                    frames[j],
+                    direction=step_delta,
+                    ident=frame_idents[(i - 1) * len(frames) + j],
+                    start_node_id=starts[i - 1, j],
+                    end_node_id=ends[i - 1, j],
+                )
+                new_objs.append(new_frame.obj)
+
+        if edge_cols:
+            copies = BlenderFrameAdapter.replicate_edges(
+                [frames[j] for j in edge_cols],
+                [tuple(delta * i) for i in range(1, self.count + 1)],
+                idents=[
+                    frame_idents[i * len(frames) + j]
+                    for i in range(self.count)
+                    for j in edge_cols
+                ],
+                start_node_ids=starts[:, edge_cols],
+                end_node_ids=ends[:, edge_cols],
+            )
+            stores = {copy.obj.as_pointer(): copy.obj for copy in copies}
+            new_objs.extend(stores.values())
 
         # ----- selection handling -----
         for obj in new_objs:
@@ -63,5 +104,6 @@ class ReplicateObject(bpy.types.Operator):
 
         if new_objs:
             context.view_layer.objects.active = new_objs[-1]
+        selection_cache.invalidate()
 
         return {'FINISHED'}
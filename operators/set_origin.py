@@ -2,6 +2,8 @@
 
 import bpy
 
+from blender_adapter.core.frame import UNIT_MESH_FLAG
+
 class SetOriginOperator(bpy.types.Operator):
     """Set origin to geometry for selected objects"""
     bl_idname = "som.set_origin_to_geometry"
@@ -20,8 +22,24 @@ class SetOriginOperator(bpy.types.Operator):
         if context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
 
+        # Unit frames (FrameStorage.SHARED) already have their origin at
+        # the midpoint; origin_set would only edit the shared unit mesh
+        # under every other frame. Leave them out of the selection.
+        skipped = [
+            obj for obj in context.selected_objects
+            if obj.type == 'MESH'
+            and obj.data is not None
+            and obj.data.get(UNIT_MESH_FLAG)
+        ]
+        for obj in skipped:
+            obj.select_set(False)
+
         # Apply to all selected objects
-        bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='MEDIAN')
+        if context.selected_objects:
+            bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='MEDIAN')
+
+        for obj in skipped:
+            obj.select_set(True)
 
         self.report({'INFO'}, "Origin set to geometry")
         return {'FINISHED'}
@@ -0,0 +1,139 @@
+# blender_adapter/service/handlers.py
+
+from typing import NamedTuple
+
+import bpy
+from bpy.app.handlers import persistent
+
+
+class DepsgraphUpdates(NamedTuple):
+    scene: bpy.types.Scene
+    objects: list      # original objects that were updated
+    meshes: list       # original meshes whose geometry changed
+    others: bool       # any other ID type (collection, view layer, …)
+
+
+class HandlerDispatcher:
+    """
+    The add-on's only depsgraph / load / undo / redo handlers and the
+    owner of its msgbus subscriptions.
+
+    Services subscribe callbacks instead of registering their own
+    handlers, so `depsgraph.updates` is scanned once per update however
+    many caches listen, and msgbus subscriptions (which do not survive
+    loading a file) are renewed in one place. Handlers are installed with
+    the first subscriber and removed with the last one.
+    - subscribe_update: `callback(updates: DepsgraphUpdates)`
+    - subscribe_file: `callback()` after load, undo and redo
+    - subscribe_rna: `[(key, notify), ...]` msgbus subscriptions of an
+      owner, renewed after load, undo and redo
+    """
+
+    def __init__(self):
+        self._update: list = []
+        self._file: list = []
+        self._rna: dict[object, list[tuple]] = {}   # owner → (key, notify)
+
+    def subscribe_update(self, callback):
+        if callback not in self._update:
+            self._update.append(callback)
+        self._install()
+
+    def subscribe_file(self, callback):
+        if callback not in self._file:
+            self._file.append(callback)
+        self._install()
+
+    def unsubscribe(self, callback):
+        for callbacks in (self._update, self._file):
+            if callback in callbacks:
+                callbacks.remove(callback)
+        self._uninstall_if_unused()
+
+    def subscribe_rna(self, owner, subscriptions):
+        self._rna[owner] = list(subscriptions)
+        self._subscribe_rna(owner)
+        self._install()
+
+    def unsubscribe_rna(self, owner):
+        if self._rna.pop(owner, None) is not None:
+            bpy.msgbus.clear_by_owner(owner)
+        self._uninstall_if_unused()
+
+    def _subscribe_rna(self, owner):
+        bpy.msgbus.clear_by_owner(owner)
+        for key, notify in self._rna[owner]:
+            bpy.msgbus.subscribe_rna(key=key, owner=owner, args=(), notify=notify)
+
+    # ---------- dispatch ----------
+
+    def _on_file_changed(self):
+        # msgbus subscriptions do not survive loading a file
+        for owner in tuple(self._rna):
+            self._subscribe_rna(owner)
+
+        for callback in tuple(self._file):
+            callback()
+
+    def _on_depsgraph_update(self, scene, depsgraph):
+        if not self._update:
+            return
+
+        objects = []
+        meshes = []
+        others = False
+        for update in depsgraph.updates:
+            original = update.id.original
+
+            if isinstance(original, bpy.types.Object):
+                objects.append(original)
+                if update.is_updated_geometry and isinstance(
+                    original.data, bpy.types.Mesh
+                ):
+                    meshes.append(original.data)
+            elif isinstance(original, bpy.types.Mesh):
+                meshes.append(original)
+            elif not isinstance(original, bpy.types.Scene):
+                others = True
+
+        updates = DepsgraphUpdates(scene, objects, meshes, others)
+        for callback in tuple(self._update):
+            callback(updates)
+
+    # ---------- bpy.app.handlers ----------
+
+    @staticmethod
+    def _handlers():
+        h = bpy.app.handlers
+        return (
+            (h.depsgraph_update_post, _on_depsgraph_update),
+            (h.load_post, _on_file_changed),
+            (h.undo_post, _on_file_changed),
+            (h.redo_post, _on_file_changed),
+        )
+
+    def _install(self):
+        for handlers, func in self._handlers():
+            if func not in handlers:
+                handlers.append(func)
+
+    def _uninstall_if_unused(self):
+        if self._update or self._file or self._rna:
+            return
+
+        for handlers, func in self._handlers():
+            if func in handlers:
+                handlers.remove(func)
+
+
+handler_dispatcher = HandlerDispatcher()
+
+
+@persistent
+def _on_file_changed(*_args):
+    handler_dispatcher._on_file_changed()
+
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    handler_dispatcher._on_depsgraph_update(scene, depsgraph)
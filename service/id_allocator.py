@@ -0,0 +1,104 @@
+# blender_adapter/service/id_allocator.py
+
+import bpy
+
+from blender_adapter.core.base import DomainKind
+from blender_adapter.service.handlers import handler_dispatcher
+from blender_adapter.service.label.base import AddonService
+
+
+class IdAllocator(AddonService):
+    """
+    Hands out domain IDs from per-scene high-water-mark counters
+    (stored on Scene.som_ids, so they are saved with the .blend).
+
+    Counters are re-synced against bpy.data.objects once after
+    file load / undo / redo, never on each create.
+    """
+
+    PREFIXES = {
+        DomainKind.NODE: "N",
+        DomainKind.FRAME: "F",
+    }
+
+    FIELDS = {
+        DomainKind.NODE: "node_last",
+        DomainKind.FRAME: "frame_last",
+    }
+
+    def __init__(self):
+        self._synced = False
+
+    # ---------- public API ----------
+
+    def reserve_range(self, kind: str, count: int) -> range:
+        """
+        Reserve `count` consecutive indices in one call.
+        """
+        if count <= 0:
+            return range(0)
+
+        if not self._synced:
+            self.rebuild()
+
+        scene = bpy.context.scene
+        field = self.FIELDS[kind]
+
+        # Object names are file-global → never go below any scene's mark
+        last = max(getattr(s.som_ids, field) for s in bpy.data.scenes)
+        setattr(scene.som_ids, field, last + count)
+
+        return range(last + 1, last + count + 1)
+
+    def reserve(self, kind: str, count: int = 1) -> list[tuple[str, str]]:
+        """
+        Reserve `count` IDs. Returns [(id, name), ...] in allocation order.
+        """
+        prefix = self.PREFIXES[kind]
+        return [
+            (str(idx), f"{prefix}{idx}")
+            for idx in self.reserve_range(kind, count)
+        ]
+
+    def next_id(self, kind: str) -> tuple[str, str]:
+        return self.reserve(kind, 1)[0]
+
+    # ---------- sync ----------
+
+    def rebuild(self):
+        """
+        Single scan of bpy.data.objects → raise every scene counter
+        to the highest index found in object names.
+        """
+        found = {kind: 0 for kind in self.PREFIXES}
+
+        for obj in bpy.data.objects:
+            name = obj.name
+            for kind, prefix in self.PREFIXES.items():
+                if name.startswith(prefix):
+                    suffix = name[len(prefix):]
+                    if suffix.isdigit():
+                        found[kind] = max(found[kind], int(suffix))
+
+        for scene in bpy.data.scenes:
+            counters = scene.som_ids
+            for kind, field in self.FIELDS.items():
+                if getattr(counters, field) < found[kind]:
+                    setattr(counters, field, found[kind])
+
+        self._synced = True
+
+    def invalidate(self):
+        self._synced = False
+
+    # ---------- AddonService ----------
+
+    def enable(self):
+        self.invalidate()
+        handler_dispatcher.subscribe_file(self.invalidate)
+
+    def disable(self):
+        handler_dispatcher.unsubscribe(self.invalidate)
+
+
+id_allocator = IdAllocator()
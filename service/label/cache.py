@@ -0,0 +1,180 @@
+# blender_adapter/service/label/cache.py
+
+import numpy as np
+
+from blender_adapter.service.handlers import handler_dispatcher
+
+
+class LabelCache:
+    """
+    World anchor, text and kind of every label of one overlay, per object.
+
+    `collect(obj, state)` returns the (anchor, text, kind) rows of one
+    object ([] if it has no label); `state` is the overlay's display
+    toggles. Rows are rebuilt only when:
+    - the display state changes (full rebuild)
+    - the depsgraph reports an object update (that object only)
+    - objects are deleted, collections / view layers change, undo or
+      load (full rebuild)
+    so a redraw only reads the packed arrays.
+    """
+
+    def __init__(self, collect):
+        self._collect = collect
+        self._rows: dict[int, list[tuple]] = {}   # pointer → rows
+        self._dirty: dict[int, object] = {}       # pointer → object
+        self._dirty_all = True
+        self._state = None
+
+        self._anchors = np.empty((0, 3))
+        self._texts: list[str] = []
+        self._kinds: list[str] = []
+        self._owners = np.empty(0, dtype=np.int64)  # object pointer per label
+        self._packed = False
+        self.revision = 0   # bumped only when the packed labels change
+
+    def __len__(self):
+        return len(self._texts)
+
+    # ---------- invalidation ----------
+
+    def invalidate(self):
+        self._dirty_all = True
+        self._dirty.clear()
+
+    def invalidate_object(self, obj):
+        if not self._dirty_all:
+            self._dirty[obj.as_pointer()] = obj
+
+    # ---------- read ----------
+
+    def labels(self, context, state) -> tuple[np.ndarray, list, list]:
+        """
+        (N, 3) world anchors, N texts and N kinds for `state`.
+        """
+        if state != self._state:
+            self._state = state
+            self.invalidate()
+
+        if self._dirty_all:
+            self._rebuild(context)
+        elif self._dirty:
+            self._refresh()
+
+        if not self._packed:
+            self._pack()
+
+        return self._anchors, self._texts, self._kinds
+
+    @property
+    def owners(self) -> np.ndarray:
+        """
+        (N,) pointer of the object each label of the last `labels()`
+        call belongs to.
+        """
+        return self._owners
+
+    def _rebuild(self, context):
+        state = self._state
+        self._rows = {}
+        for obj in context.visible_objects:
+            rows = self._collect(obj, state)
+            if rows:
+                self._rows[obj.as_pointer()] = rows
+
+        self._dirty_all = False
+        self._dirty.clear()
+        self._packed = False
+
+    def _refresh(self):
+        state = self._state
+        for ptr, obj in self._dirty.items():
+            try:
+                rows = self._collect(obj, state) if obj.visible_get() else []
+            except ReferenceError:
+                rows = []
+
+            if rows:
+                self._rows[ptr] = rows
+            else:
+                self._rows.pop(ptr, None)
+
+        self._dirty.clear()
+        self._packed = False
+
+    def _pack(self):
+        rows = [row for chunk in self._rows.values() for row in chunk]
+        if rows:
+            anchors = np.asarray(
+                [tuple(row[0]) for row in rows], dtype=np.float64
+            )
+        else:
+            anchors = np.empty((0, 3))
+        texts = [row[1] for row in rows]
+        owners = np.repeat(
+            np.fromiter(self._rows.keys(), dtype=np.int64, count=len(self._rows)),
+            [len(chunk) for chunk in self._rows.values()],
+        )
+        changed = (
+            texts != self._texts
+            or not np.array_equal(anchors, self._anchors)
+            or not np.array_equal(owners, self._owners)
+        )
+
+        self._anchors = anchors
+        self._texts = texts
+        self._kinds = [row[2] for row in rows]
+        self._owners = owners
+        self._packed = True
+        if changed:
+            self.revision += 1
+
+
+# ---------- depsgraph / file callbacks (shared by all caches) ----------
+
+_caches: list[LabelCache] = []
+_object_count = 0
+
+
+def attach(cache: LabelCache):
+    if cache not in _caches:
+        _caches.append(cache)
+    cache.invalidate()
+
+    handler_dispatcher.subscribe_file(_on_file_changed)
+    handler_dispatcher.subscribe_update(_on_depsgraph_update)
+
+
+def detach(cache: LabelCache):
+    if cache in _caches:
+        _caches.remove(cache)
+    if _caches:
+        return
+
+    handler_dispatcher.unsubscribe(_on_file_changed)
+    handler_dispatcher.unsubscribe(_on_depsgraph_update)
+
+
+def _on_file_changed():
+    for cache in _caches:
+        cache.invalidate()
+
+
+def _on_depsgraph_update(updates):
+    global _object_count
+
+    # deletions do not arrive as object updates
+    count = len(updates.scene.objects)
+    structural = count < _object_count
+    _object_count = count
+
+    # collection / view layer: membership or visibility may have changed
+    # (mesh edits arrive with their object as well)
+    structural = structural or updates.others
+
+    for cache in _caches:
+        if structural:
+            cache.invalidate()
+            continue
+        for obj in updates.objects:
+            cache.invalidate_object(obj)
@@ -0,0 +1,109 @@
+# blender_adapter/service/label/draw.py
+
+import blf
+import numpy as np
+
+from blender_adapter.utils.projection import project_points
+
+LABEL_OFFSET = 8
+
+# label priority (higher wins a declutter cell / the label budget)
+PRIORITY_OTHER = 0
+PRIORITY_ACTIVE = 1
+PRIORITY_SELECTED = 2
+
+
+def label_priority(context, owners) -> np.ndarray:
+    """
+    (N,) priority per label from the pointer of its owning object:
+    selected > active (unselected) > others.
+    """
+    priority = np.full(len(owners), PRIORITY_OTHER, dtype=np.int8)
+    if not len(owners):
+        return priority
+
+    active = context.active_object
+    if active is not None:
+        priority[owners == active.as_pointer()] = PRIORITY_ACTIVE
+
+    selected = [obj.as_pointer() for obj in context.selected_objects]
+    if selected:
+        priority[np.isin(owners, selected)] = PRIORITY_SELECTED
+
+    return priority
+
+
+def declutter(screen, priority, cell: float, budget: int = 0) -> np.ndarray:
+    """
+    Indices of the labels to keep: at most one per `cell` px screen cell
+    (the highest priority one) and at most `budget` overall (0 = no
+    limit), highest priority first.
+    """
+    order = np.argsort(-priority.astype(np.int16), kind="stable")
+
+    if cell > 0:
+        cells = np.floor(screen[order] / cell).astype(np.int64)
+        _, first = np.unique(cells, axis=0, return_index=True)
+        order = order[np.sort(first)]
+
+    if budget > 0:
+        order = order[:budget]
+
+    return order
+
+
+def layout_labels(
+    region,
+    rv3d,
+    anchors,
+    texts,
+    priority=None,
+    cell: float = 0.0,
+    budget: int = 0,
+) -> list[tuple[float, float, str]]:
+    """
+    Draw list (x, y, text) for `texts` next to their (N, 3) world
+    `anchors`.
+
+    All anchors are projected in one matrix multiply; anything behind the
+    camera or outside the region is dropped. With `cell` / `budget` the
+    visible labels are decluttered by `priority` first.
+    """
+    if not len(texts):
+        return []
+
+    screen, visible = project_points(region, rv3d, anchors)
+    ids = np.flatnonzero(visible)
+    if not len(ids):
+        return []
+
+    screen = screen[ids]
+
+    if cell > 0 or budget > 0:
+        if priority is None:
+            priority = np.zeros(len(texts), dtype=np.int8)
+        keep = declutter(screen, priority[ids], cell, budget)
+        ids = ids[keep]
+        screen = screen[keep]
+
+    screen = screen + LABEL_OFFSET
+
+    return [
+        (x, y, texts[i]) for i, (x, y) in zip(ids.tolist(), screen.tolist())
+    ]
+
+
+def draw_list(font_id, font_size, items) -> int:
+    """
+    Replay a draw list from `layout_labels`; font state is set once.
+    """
+    if not items:
+        return 0
+
+    blf.size(font_id, font_size)
+    for x, y, text in items:
+        blf.position(font_id, x, y, 0)
+        blf.draw(font_id, text)
+
+    return len(items)
+
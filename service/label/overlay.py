@@ -0,0 +1,272 @@
+# blender_adapter/service/label/overlay.py
+
+import bpy
+
+from blender_adapter.core.base import DomainKind
+from blender_adapter.core.frame import FrameRNA
+from blender_adapter.core.node import NodeRNA
+from blender_adapter.service.label import cache
+from blender_adapter.service.handlers import handler_dispatcher
+from blender_adapter.service.label.base import AddonService
+from blender_adapter.service.label.cache import LabelCache
+from blender_adapter.service.label.draw import (
+    draw_list,
+    label_priority,
+    layout_labels,
+)
+from blender_adapter.service.label.frame import frame_labels, frame_store_labels
+from blender_adapter.service.label.node import node_labels
+from blender_adapter.service.registry import classify
+from blender_adapter.ui.panel_main import SoM_DisplaySettings
+from blender_adapter.utils.projection import region_view_key
+
+
+class LabelKind:
+    """
+    One pluggable label kind: the som_display toggles it depends on and
+    `provider(obj, toggles) -> [(anchor, text, kind), ...]`.
+    Domain kinds are matched through `classify`; other kinds pass
+    `match(obj) -> bool`.
+    """
+
+    def __init__(self, kind: str, provider, toggles: tuple[str, ...], match=None):
+        self.kind = kind
+        self.provider = provider
+        self.toggles = toggles
+        self.match = match
+
+
+class LabelOverlay(AddonService):
+    """
+    Single POST_PIXEL overlay for every domain label.
+
+    Objects are classified once per cache rebuild and handed to the
+    provider registered for their kind, so adding a label kind (supports,
+    loads, section names, …) adds no extra scene pass or draw handler.
+
+    Each region keeps its laid-out draw list and replays it until the
+    overlay is marked dirty (depsgraph update, msgbus notification on
+    SoM_DisplaySettings / NodeRNA / FrameRNA) or the view changes.
+    msgbus changes tag VIEW_3D areas only if the output changes.
+    """
+
+    def __init__(self):
+        self._handle = None
+        self.font_id = 0
+        self.font_size = 12
+        self._last_state = None
+        self._kinds: dict[str, LabelKind] = {}
+        self._cache = LabelCache(self._collect)
+
+        self._owner = object()   # msgbus subscription owner
+        self._dirty = True
+        self._epoch = 0
+        self._draw_lists: dict[int, tuple[tuple, list]] = {}  # per region
+
+    # ---------- label kinds ----------
+
+    def register(self, kind: str, provider, toggles: tuple[str, ...], match=None):
+        self._kinds[kind] = LabelKind(kind, provider, toggles, match)
+        self._cache.invalidate()
+
+    def unregister(self, kind: str):
+        if self._kinds.pop(kind, None) is not None:
+            self._cache.invalidate()
+
+    def _state(self, display) -> tuple:
+        """
+        Values of every registered toggle, per kind.
+        """
+        return tuple(
+            (name, tuple(getattr(display, t) for t in label.toggles))
+            for name, label in self._kinds.items()
+        )
+
+    def _kind_of(self, obj) -> str | None:
+        key = classify(obj)
+        if key is not None:
+            return key[0]
+
+        for label in self._kinds.values():
+            if label.match is not None and label.match(obj):
+                return label.kind
+
+        return None
+
+    def _collect(self, obj, state):
+        kind = self._kind_of(obj)
+        if kind is None:
+            return []
+
+        label = self._kinds.get(kind)
+        if label is None:
+            return []
+
+        toggles = dict(state).get(kind)
+        if not toggles or not any(toggles):
+            return []
+
+        return label.provider(obj, toggles)
+
+    # ---------- drawing ----------
+
+    def _draw(self):
+        context = bpy.context
+        scene = context.scene
+
+        # ------------------------------------------------------------------
+        # Guard: display state must exist
+        # ------------------------------------------------------------------
+        display = getattr(scene, "som_display", None)
+        if not display:
+            return
+
+        # ------------------------------------------------------------------
+        # Guard: nothing enabled → nothing to draw
+        # ------------------------------------------------------------------
+        state = self._state(display)
+        if not any(any(toggles) for _kind, toggles in state):
+            return
+
+        # ------------------------------------------------------------------
+        # Guard: must be in a 3D view region
+        # ------------------------------------------------------------------
+        region = context.region
+        rv3d = context.region_data
+        if not region or not rv3d:
+            return
+
+        # ------------------------------------------------------------------
+        # Replay the region's draw list unless labels, selection or view
+        # changed since it was laid out
+        # ------------------------------------------------------------------
+        if self._dirty:
+            self._dirty = False
+            self._epoch += 1
+
+        anchors, texts, _kinds = self._cache.labels(context, state)
+        lod = self._lod(display)
+        self._last_state = (state, lod)
+
+        key = (
+            self._epoch,
+            self._cache.revision,
+            self._last_state,
+            region_view_key(region, rv3d),
+        )
+        entry = self._draw_lists.get(region.as_pointer())
+        if entry is None or entry[0] != key:
+            cell, budget = lod
+            items = layout_labels(
+                region,
+                rv3d,
+                anchors,
+                texts,
+                priority=label_priority(context, self._cache.owners),
+                cell=cell,
+                budget=budget,
+            )
+            entry = self._draw_lists[region.as_pointer()] = (key, items)
+
+        draw_list(self.font_id, self.font_size, entry[1])
+
+    @staticmethod
+    def _lod(display) -> tuple[int, int]:
+        cell = display.declutter_cell if display.declutter_labels else 0
+        return cell, display.max_labels
+
+    def _tag_redraw(self, context):
+        live = set()
+        for window in context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type != 'VIEW_3D':
+                    continue
+                area.tag_redraw()
+                live.update(region.as_pointer() for region in area.regions)
+
+        # draw lists of closed areas / screens
+        for ptr in self._draw_lists.keys() - live:
+            del self._draw_lists[ptr]
+
+    # ---------- change tracking ----------
+
+    def mark_dirty(self, redraw: bool = False):
+        self._dirty = True
+        if redraw:
+            self._tag_redraw(bpy.context)
+
+    def _on_display_changed(self):
+        display = getattr(bpy.context.scene, "som_display", None)
+        if display is None:
+            return
+
+        # toggles that do not change the output (e.g. re-setting a value)
+        # need no redraw
+        if (self._state(display), self._lod(display)) == self._last_state:
+            return
+        self.mark_dirty(redraw=True)
+
+    def _on_domain_changed(self):
+        # label / id edits on NodeRNA / FrameRNA do not reach the depsgraph
+        self._cache.invalidate()
+        if self._last_state is None:
+            return   # nothing drawn yet
+
+        # edits that leave the labels as they were (hidden kind, same
+        # text) need no redraw
+        revision = self._cache.revision
+        self._cache.labels(bpy.context, self._last_state[0])
+        if self._cache.revision != revision:
+            self.mark_dirty(redraw=True)
+
+    def _on_depsgraph_update(self, _updates):
+        # transforms, selection, visibility: the viewport redraws anyway,
+        # only the draw lists have to be laid out again
+        self.mark_dirty()
+
+    # ---------- AddonService ----------
+
+    def enable(self):
+        cache.attach(self._cache)
+        handler_dispatcher.subscribe_rna(
+            self._owner,
+            [
+                (SoM_DisplaySettings, self._on_display_changed),
+                (NodeRNA, self._on_domain_changed),
+                (FrameRNA, self._on_domain_changed),
+            ],
+        )
+        if self._handle is None:
+            self._handle = bpy.types.SpaceView3D.draw_handler_add(
+                self._draw, (), 'WINDOW', 'POST_PIXEL'
+            )
+
+        handler_dispatcher.subscribe_file(self.mark_dirty)
+        handler_dispatcher.subscribe_update(self._on_depsgraph_update)
+
+    def disable(self):
+        handler_dispatcher.unsubscribe(self.mark_dirty)
+        handler_dispatcher.unsubscribe(self._on_depsgraph_update)
+        handler_dispatcher.unsubscribe_rna(self._owner)
+
+        if self._handle:
+            bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+            self._handle = None
+        cache.detach(self._cache)
+        self._draw_lists.clear()
+
+
+label_overlay = LabelOverlay()
+
+label_overlay.register(
+    DomainKind.NODE, node_labels, ("show_node_id", "show_node_label")
+)
+label_overlay.register(
+    DomainKind.FRAME, frame_labels, ("show_frame_id", "show_frame_label")
+)
+label_overlay.register(
+    DomainKind.FRAME_STORE,
+    frame_store_labels,
+    ("show_frame_id", "show_frame_label"),
+)
+
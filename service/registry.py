@@ -0,0 +1,355 @@
+# blender_adapter/service/registry.py
+
+import logging
+
+import bpy
+import numpy as np
+
+from blender_adapter.core.base import DomainKind
+from blender_adapter.core.frame import ATTR_FRAME_ID
+from blender_adapter.crud.batch import get_all
+from blender_adapter.service.handlers import handler_dispatcher
+from blender_adapter.service.label.base import AddonService
+
+log = logging.getLogger("BlenderAdapter")
+
+
+def classify(obj) -> tuple[str, str] | None:
+    """
+    (kind, domain id) for a domain object, None for anything else.
+    Frame stores carry no domain id and are keyed by object name.
+    """
+    rna = getattr(obj, "node_rna", None)
+    if rna is not None and rna.node_type == DomainKind.NODE:
+        return DomainKind.NODE, rna.node_id
+
+    rna = getattr(obj, "frame_rna", None)
+    if rna is not None:
+        if rna.frame_type == DomainKind.FRAME:
+            return DomainKind.FRAME, rna.frame_id
+        if rna.frame_type == DomainKind.FRAME_STORE:
+            return DomainKind.FRAME_STORE, obj.name
+
+    return None
+
+
+class DomainRegistry(AddonService):
+    """
+    In-memory index of domain objects:
+      (kind, id) → {pointer: object}   (Shift+D copies share an id)
+      kind → {pointer: object}
+      frame id → (frame store, edge index)   (FrameStorage.EDGES)
+
+    Kept current by CRUD calls (add / discard) and by depsgraph,
+    undo and load handlers. Anything the handlers cannot patch
+    incrementally (external deletes, undo, file load) marks the
+    index dirty and it is rebuilt with one scan on the next lookup.
+    Store frames are re-read (one foreach_get per store) lazily, on the
+    first `edge()` lookup after the store changed.
+    """
+
+    def __init__(self):
+        self._by_id: dict[tuple[str, str], dict[int, bpy.types.Object]] = {}
+        self._by_kind: dict[str, dict[int, bpy.types.Object]] = {
+            DomainKind.NODE: {},
+            DomainKind.FRAME: {},
+            DomainKind.FRAME_STORE: {},
+        }
+        self._keys: dict[int, tuple[str, str]] = {}  # pointer → (kind, id)
+        self._edges: dict[str, tuple[bpy.types.Object, int]] = {}
+        self._edge_ids: dict[int, list[str]] = {}   # store pointer → frame ids
+        self._stale_stores: dict[int, bpy.types.Object] = {}
+        self._count = -1  # len(bpy.data.objects) at last sync
+        self._dirty = True
+
+        # Validation mode: diff against a full scan after every sync
+        self.validate_on_sync = False
+
+    # ---------- lookups ----------
+
+    def get(self, kind: str, domain_id: str):
+        """
+        Object with this id; the first indexed one if several share it.
+        """
+        key = (kind, domain_id)
+        self._ensure()
+        objs = self._by_id.get(key)
+        if not objs:
+            return None
+
+        obj = next(iter(objs.values()))
+        try:
+            if classify(obj) == key:
+                return obj
+        except ReferenceError:
+            pass
+
+        # Stale entry (removed / re-typed behind our back)
+        self._dirty = True
+        self._ensure()
+        objs = self._by_id.get(key)
+        return next(iter(objs.values())) if objs else None
+
+    def duplicates(self) -> dict[tuple[str, str], list[bpy.types.Object]]:
+        """
+        (kind, id) → objects for every id held by more than one object.
+        """
+        self._ensure()
+        return {
+            key: list(objs.values())
+            for key, objs in self._by_id.items()
+            if len(objs) > 1
+        }
+
+    def edge(self, frame_id: str) -> tuple[bpy.types.Object, int] | None:
+        """
+        (store, edge index) of a store frame, or None.
+        """
+        self._ensure()
+        self._index_stale_stores()
+
+        entry = self._edges.get(frame_id)
+        if entry is None:
+            return None
+
+        store, index = entry
+        try:
+            data = store.data.attributes[ATTR_FRAME_ID].data
+            if index < len(data) and str(data[index].value) == frame_id:
+                return entry
+        except (ReferenceError, KeyError):
+            self._dirty = True
+            self._ensure()
+            self._index_stale_stores()
+            return self._edges.get(frame_id)
+
+        # compacted since it was indexed
+        self._index_store(store)
+        return self._edges.get(frame_id)
+
+    def contains(self, kind: str, domain_id: str) -> bool:
+        return self.get(kind, domain_id) is not None
+
+    def objects(self, kind: str) -> list[bpy.types.Object]:
+        self._ensure()
+        objs = list(self._by_kind[kind].values())
+
+        try:
+            for obj in objs:
+                obj.as_pointer()
+        except ReferenceError:
+            self._dirty = True
+            self._ensure()
+            objs = list(self._by_kind[kind].values())
+
+        return objs
+
+    def count(self, kind: str) -> int:
+        self._ensure()
+        return len(self._by_kind[kind])
+
+    # ---------- mutation ----------
+
+    def add(self, obj):
+        if self._dirty:
+            return  # picked up by the next rebuild
+
+        self._index(obj)
+        self._count = len(bpy.data.objects)
+
+    def add_many(self, objs):
+        if self._dirty:
+            return
+
+        for obj in objs:
+            self._index(obj)
+        self._count = len(bpy.data.objects)
+
+    def discard(self, obj):
+        """
+        Call BEFORE the object is removed (pointer must still be valid).
+        """
+        if self._dirty:
+            return
+
+        self._unindex(obj.as_pointer())
+        self._count = len(bpy.data.objects) - 1
+
+    def discard_many(self, objs):
+        """
+        Batch form of discard(); one count update for the whole batch.
+        """
+        if self._dirty:
+            return
+
+        objs = list(objs)
+        for obj in objs:
+            self._unindex(obj.as_pointer())
+        self._count = len(bpy.data.objects) - len(objs)
+
+    def invalidate(self):
+        self._dirty = True
+
+    # ---------- sync ----------
+
+    def rebuild(self):
+        self._by_id.clear()
+        self._keys.clear()
+        self._edges.clear()
+        self._edge_ids.clear()
+        self._stale_stores.clear()
+        for objs in self._by_kind.values():
+            objs.clear()
+
+        for obj in bpy.data.objects:
+            self._index(obj)
+
+        self._count = len(bpy.data.objects)
+        self._dirty = False
+
+        duplicates = [
+            (key, [obj.name for obj in objs.values()])
+            for key, objs in self._by_id.items()
+            if len(objs) > 1
+        ]
+        if duplicates:
+            log.warning(f"DomainRegistry duplicate ids: {duplicates}")
+
+        if self.validate_on_sync:
+            self._report(self.validate())
+
+    def validate(self) -> dict[str, list]:
+        """
+        Diff the index against a full scan.
+        Empty lists everywhere → index is trustworthy.
+        """
+        expected: dict[tuple[str, str], list[str]] = {}
+        for obj in bpy.data.objects:
+            key = classify(obj)
+            if key is not None:
+                expected.setdefault(key, []).append(obj.name)
+
+        missing = [key for key in expected if key not in self._by_id]
+        duplicates = [
+            (key, names) for key, names in expected.items() if len(names) > 1
+        ]
+
+        stale = []
+        for key, objs in self._by_id.items():
+            for obj in objs.values():
+                try:
+                    if classify(obj) != key:
+                        stale.append(key)
+                except ReferenceError:
+                    stale.append(key)
+
+        return {
+            "missing": missing,
+            "stale": stale,
+            "duplicates": duplicates,
+        }
+
+    def _report(self, diff):
+        for problem, keys in diff.items():
+            if keys:
+                log.warning(f"DomainRegistry {problem}: {keys}")
+
+    def _ensure(self):
+        if self._dirty:
+            self.rebuild()
+
+    def _index(self, obj):
+        key = classify(obj)
+        ptr = obj.as_pointer()
+
+        if self._keys.get(ptr) != key:
+            self._unindex(ptr)
+
+        if key is None:
+            return
+
+        self._keys[ptr] = key
+        self._by_id.setdefault(key, {})[ptr] = obj
+        self._by_kind[key[0]][ptr] = obj
+        if key[0] == DomainKind.FRAME_STORE:
+            self._stale_stores[ptr] = obj
+
+    def _unindex(self, ptr: int):
+        key = self._keys.pop(ptr, None)
+        if key is None:
+            return
+
+        self._by_kind[key[0]].pop(ptr, None)
+        if key[0] == DomainKind.FRAME_STORE:
+            self._stale_stores.pop(ptr, None)
+            self._unindex_store(ptr)
+
+        objs = self._by_id.get(key)
+        if objs is not None:
+            objs.pop(ptr, None)
+            if not objs:
+                del self._by_id[key]
+
+    def _index_stale_stores(self):
+        while self._stale_stores:
+            _ptr, store = self._stale_stores.popitem()
+            self._index_store(store)
+
+    def _index_store(self, store):
+        ptr = store.as_pointer()
+        self._unindex_store(ptr)
+
+        attr = store.data.attributes.get(ATTR_FRAME_ID)
+        if attr is None:
+            return
+
+        ids = [str(i) for i in get_all(attr.data, "value", dtype=np.int32).tolist()]
+        self._edges.update((frame_id, (store, i)) for i, frame_id in enumerate(ids))
+        self._edge_ids[ptr] = ids
+
+    def _unindex_store(self, ptr: int):
+        for frame_id in self._edge_ids.pop(ptr, ()):
+            entry = self._edges.get(frame_id)
+            if entry is None:
+                continue
+            try:
+                owned = entry[0].as_pointer() == ptr
+            except ReferenceError:
+                owned = True
+            if owned:
+                del self._edges[frame_id]
+
+    # ---------- handlers ----------
+
+    def _on_depsgraph_update(self, updates):
+        if self._dirty:
+            return
+
+        for obj in updates.objects:
+            self._index(obj)
+
+        # Objects removed outside the CRUD layer (X key, outliner, …).
+        # Additions show up in depsgraph.updates and are indexed above.
+        count = len(bpy.data.objects)
+        if count < self._count:
+            self._dirty = True
+            return
+        self._count = count
+
+        if self.validate_on_sync:
+            self._report(self.validate())
+
+    # ---------- AddonService ----------
+
+    def enable(self):
+        self.invalidate()
+        handler_dispatcher.subscribe_file(self.invalidate)
+        handler_dispatcher.subscribe_update(self._on_depsgraph_update)
+
+    def disable(self):
+        handler_dispatcher.unsubscribe(self.invalidate)
+        handler_dispatcher.unsubscribe(self._on_depsgraph_update)
+        self.invalidate()
+
+
+domain_registry = DomainRegistry()
@@ -0,0 +1,84 @@
+# blender_adapter/service/selection.py
+
+import bpy
+
+from blender_adapter.core.base import DomainKind
+from blender_adapter.core.frame import FrameRNA
+from blender_adapter.core.node import NodeRNA
+from blender_adapter.service.handlers import handler_dispatcher
+from blender_adapter.service.label.base import AddonService
+from blender_adapter.service.registry import classify
+
+
+class SelectionCache(AddonService):
+    """
+    Selected objects of each view layer, classified by domain kind.
+
+    Only operator poll() (called on every sidebar redraw) reads it
+    instead of walking `context.selected_objects`; execute() goes through
+    the CRUD `selected()` helpers, which read the live selection, since
+    select_set() from a script reaches the cache only with the next
+    depsgraph update. It is dropped on depsgraph updates, on msgbus
+    notifications for the active object and NodeRNA / FrameRNA edits,
+    and on undo / load.
+    """
+
+    def __init__(self):
+        # view layer pointer → kind → selected objects
+        self._layers: dict[int, dict[str, list[bpy.types.Object]]] = {}
+        self._owner = object()   # msgbus subscription owner
+
+    # ---------- lookups ----------
+
+    def classified(self, context) -> dict[str, list[bpy.types.Object]]:
+        ptr = context.view_layer.as_pointer()
+        result = self._layers.get(ptr)
+        if result is None:
+            result = self._layers[ptr] = self._classify(context)
+        return result
+
+    def has_domain(self, context) -> bool:
+        """
+        True if any selected object is a node, frame or frame store.
+        O(1) while the selection is unchanged.
+        """
+        return any(self.classified(context).values())
+
+    @staticmethod
+    def _classify(context) -> dict[str, list[bpy.types.Object]]:
+        result = {
+            DomainKind.NODE: [],
+            DomainKind.FRAME: [],
+            DomainKind.FRAME_STORE: [],
+        }
+        for obj in context.selected_objects:
+            key = classify(obj)
+            if key is not None:
+                result[key[0]].append(obj)
+        return result
+
+    def invalidate(self, *_args):
+        self._layers.clear()
+
+    # ---------- AddonService ----------
+
+    def enable(self):
+        self.invalidate()
+        handler_dispatcher.subscribe_rna(
+            self._owner,
+            [
+                ((bpy.types.LayerObjects, "active"), self.invalidate),
+                (NodeRNA, self.invalidate),
+                (FrameRNA, self.invalidate),
+            ],
+        )
+        handler_dispatcher.subscribe_file(self.invalidate)
+        handler_dispatcher.subscribe_update(self.invalidate)
+
+    def disable(self):
+        handler_dispatcher.unsubscribe(self.invalidate)
+        handler_dispatcher.unsubscribe_rna(self._owner)
+        self.invalidate()
+
+
+selection_cache = SelectionCache()
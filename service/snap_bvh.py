@@ -0,0 +1,150 @@
+# blender_adapter/service/snap_bvh.py
+
+from typing import NamedTuple
+
+import numpy as np
+from bpy_extras import view3d_utils
+from mathutils import Vector
+from mathutils.bvhtree import BVHTree
+
+from blender_adapter.crud.batch import get_all
+from blender_adapter.service.snap_cache import snap_point_cache
+from blender_adapter.utils.geometry import local_vertices, transform_points
+from blender_adapter.utils.projection import (
+    cursor_mask,
+    nearest_on_segments,
+    nearest_within,
+    project_points,
+)
+
+
+class ReferenceTree(NamedTuple):
+    bvh: BVHTree | None      # None for wire meshes (edges, no faces)
+    co: np.ndarray           # (V, 3) local vertex coordinates
+    loop_start: np.ndarray   # per polygon
+    loop_total: np.ndarray   # per polygon
+    loop_verts: np.ndarray   # per loop → vertex index
+    edges: np.ndarray        # (E, 2) vertex indices, wire meshes only
+
+
+def build_reference_tree(obj) -> ReferenceTree | None:
+    """
+    BVH over the object's own mesh (local space). Polygon indices
+    returned by ray_cast match obj.data.polygons. Meshes without faces
+    (e.g. DXF line imports) keep their edges for vertex / edge snapping.
+    """
+    mesh = obj.data
+    empty = np.empty(0, dtype=np.int32)
+
+    if not mesh.polygons:
+        if not mesh.edges:
+            return None
+        edges = get_all(mesh.edges, "vertices", 2, dtype=np.int32)
+        return ReferenceTree(None, local_vertices(mesh), empty, empty, empty, edges)
+
+    co = local_vertices(mesh)
+    loop_start = get_all(mesh.polygons, "loop_start", dtype=np.int32)
+    loop_total = get_all(mesh.polygons, "loop_total", dtype=np.int32)
+    loop_verts = get_all(mesh.loops, "vertex_index", dtype=np.int32)
+
+    polygons = [
+        loop_verts[start:start + total].tolist()
+        for start, total in zip(loop_start, loop_total)
+    ]
+    bvh = BVHTree.FromPolygons(co.tolist(), polygons)
+
+    return ReferenceTree(
+        bvh, co, loop_start, loop_total, loop_verts, np.empty((0, 2), dtype=np.int32)
+    )
+
+
+def snap_reference(region, rv3d, mouse, objects, radius: float):
+    """
+    Raycast the cursor into reference meshes; return, in priority order:
+    a vertex within `radius` px, the closest point on an edge within
+    `radius` px, else the nearest face hit point. Vertices and edges come
+    from the polygon hit and from wire meshes near the cursor.
+
+    Objects whose screen bound box (grown by `radius`) misses the cursor
+    are skipped before their tree is looked up, so a click costs one BVH
+    ray cast per mesh under the cursor plus work on a single polygon.
+    """
+    objects = list(objects)
+    if not objects:
+        return None
+
+    # every reference mesh of the session fits: no rebuild per click
+    snap_point_cache.reserve_trees(len(objects))
+
+    mask = cursor_mask(
+        region,
+        rv3d,
+        [obj.matrix_world for obj in objects],
+        [obj.bound_box for obj in objects],
+        mouse,
+        radius,
+    )
+
+    mouse = np.asarray(mouse, dtype=np.float64)
+    origin = view3d_utils.region_2d_to_origin_3d(region, rv3d, mouse)
+    direction = view3d_utils.region_2d_to_vector_3d(region, rv3d, mouse)
+
+    best = None  # (distance along ray, obj, tree, polygon index, world hit)
+    segments = []  # (K, 2, 3) world edges to snap to
+
+    for obj, keep in zip(objects, mask):
+        if not keep:
+            continue
+
+        tree = snap_point_cache.tree(obj, build_reference_tree)
+        if tree is None:
+            continue
+
+        mw = obj.matrix_world
+        if tree.bvh is None:
+            world = transform_points(mw, tree.co)
+            segments.append(world[tree.edges])
+            continue
+
+        inv = mw.inverted_safe()
+        local_origin = inv @ origin
+        local_dir = (inv.to_3x3() @ direction).normalized()
+
+        location, _normal, index, _dist = tree.bvh.ray_cast(
+            local_origin, local_dir
+        )
+        if location is None:
+            continue
+
+        world_hit = mw @ location
+        distance = (world_hit - origin).length
+        if best is None or distance < best[0]:
+            best = (distance, obj, tree, index, world_hit)
+
+    if best is not None:
+        _distance, obj, tree, index, _world_hit = best
+
+        start = tree.loop_start[index]
+        verts = tree.loop_verts[start:start + tree.loop_total[index]]
+        world = transform_points(obj.matrix_world, tree.co[verts])
+        segments.append(np.stack([world, np.roll(world, -1, axis=0)], axis=1))
+
+    if not segments:
+        return None
+    segments = np.concatenate(segments)
+
+    # ---- vertex ----
+    ends = segments.reshape(-1, 3)
+    screen, visible = project_points(region, rv3d, ends)
+    hit, _dist = nearest_within(screen, visible, mouse, radius)
+    if hit >= 0:
+        return Vector(ends[hit])
+
+    # ---- edge ----
+    edge, t, _dist = nearest_on_segments(region, rv3d, segments, mouse, radius)
+    if edge >= 0:
+        start, end = segments[edge]
+        return Vector(start + (end - start) * t)
+
+    # ---- face ----
+    return best[4] if best is not None else None
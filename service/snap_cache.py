@@ -0,0 +1,153 @@
+# blender_adapter/service/snap_cache.py
+
+import itertools
+from collections import OrderedDict
+
+import numpy as np
+
+from blender_adapter.service.handlers import handler_dispatcher
+from blender_adapter.service.label.base import AddonService
+
+
+class SnapPointCache(AddonService):
+    """
+    LRU caches of world-space snap points and reference mesh BVH trees
+    per object, plus the (unbounded) snap kind of each object.
+
+    An entry is reused while the object's pointer, name, data pointer,
+    matrix_world and mesh revision are unchanged. Mesh revisions are
+    bumped from depsgraph geometry updates; undo / load clears everything
+    (pointers are not stable across them).
+    """
+
+    def __init__(self, capacity: int = 4096, tree_capacity: int = 32):
+        self.capacity = capacity
+        self.tree_capacity = tree_capacity
+        self._entries: OrderedDict[int, tuple[tuple, np.ndarray]] = OrderedDict()
+        self._trees: OrderedDict[int, tuple[tuple, object]] = OrderedDict()
+        self._mesh_rev: dict[int, int] = {}
+        self._kinds: dict[int, str | None] = {}  # pointer → snap kind
+
+    # ---------- public API ----------
+
+    def points(self, obj, compute) -> np.ndarray:
+        """
+        Cached (K, 3) points for `obj`; `compute(obj)` on a miss.
+        """
+        ptr = obj.as_pointer()
+        key = self._key(obj)
+
+        entry = self._entries.get(ptr)
+        if entry is not None and entry[0] == key:
+            self._entries.move_to_end(ptr)
+            return entry[1]
+
+        points = np.asarray(compute(obj), dtype=np.float64).reshape(-1, 3)
+        self._entries[ptr] = (key, points)
+        self._entries.move_to_end(ptr)
+
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+        return points
+
+    def tree(self, obj, build):
+        """
+        Cached local-space acceleration structure (`build(obj)`), kept
+        across transforms and rebuilt once per mesh revision.
+        """
+        ptr = obj.as_pointer()
+        data = obj.data
+        key = (obj.name, data.as_pointer(), self.revision(data))
+
+        entry = self._trees.get(ptr)
+        if entry is not None and entry[0] == key:
+            self._trees.move_to_end(ptr)
+            return entry[1]
+
+        tree = build(obj)
+        self._trees[ptr] = (key, tree)
+        self._trees.move_to_end(ptr)
+
+        while len(self._trees) > self.tree_capacity:
+            self._trees.popitem(last=False)
+
+        return tree
+
+    def reserve(self, count: int):
+        """
+        Grow the point LRU to hold `count` entries. Callers scanning every
+        visible object in a fixed order reserve the scene size first;
+        a smaller LRU would evict each entry just before it is needed.
+        """
+        if count > self.capacity:
+            self.capacity = count
+
+    def reserve_trees(self, count: int):
+        """
+        Grow the tree LRU to hold `count` trees, so a reference set larger
+        than `tree_capacity` does not rebuild every tree on every pass.
+        """
+        if count > self.tree_capacity:
+            self.tree_capacity = count
+
+    def kind(self, obj, classify) -> str | None:
+        """
+        Cached `classify(obj)`, once per object: no capacity, entries are
+        dropped on any update of the object and on undo / load.
+        """
+        ptr = obj.as_pointer()
+        try:
+            return self._kinds[ptr]
+        except KeyError:
+            kind = self._kinds[ptr] = classify(obj)
+            return kind
+
+    def revision(self, data) -> int:
+        if data is None:
+            return 0
+        return self._mesh_rev.get(data.as_pointer(), 0)
+
+    def clear(self):
+        self._entries.clear()
+        self._trees.clear()
+        self._mesh_rev.clear()
+        self._kinds.clear()
+
+    def _key(self, obj) -> tuple:
+        data = obj.data
+        return (
+            obj.name,
+            data.as_pointer() if data is not None else 0,
+            self.revision(data),
+            *itertools.chain.from_iterable(obj.matrix_world),
+        )
+
+    # ---------- handlers ----------
+
+    def _on_depsgraph_update(self, updates):
+        # RNA edits (node_type / frame_type, …) arrive as object
+        # updates and may change the kind → drop kind and points
+        for obj in updates.objects:
+            ptr = obj.as_pointer()
+            self._kinds.pop(ptr, None)
+            self._entries.pop(ptr, None)
+
+        for mesh in updates.meshes:
+            ptr = mesh.as_pointer()
+            self._mesh_rev[ptr] = self._mesh_rev.get(ptr, 0) + 1
+
+    # ---------- AddonService ----------
+
+    def enable(self):
+        self.clear()
+        handler_dispatcher.subscribe_file(self.clear)
+        handler_dispatcher.subscribe_update(self._on_depsgraph_update)
+
+    def disable(self):
+        handler_dispatcher.unsubscribe(self.clear)
+        handler_dispatcher.unsubscribe(self._on_depsgraph_update)
+        self.clear()
+
+
+snap_point_cache = SnapPointCache()
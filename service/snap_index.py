@@ -0,0 +1,173 @@
+# blender_adapter/service/snap_index.py
+
+import time
+
+import numpy as np
+from mathutils import Vector
+
+from blender_adapter.utils.projection import (
+    frustum_mask,
+    nearest_within,
+    project_points,
+    region_view_key,
+)
+
+
+class SnapIndex:
+    """
+    Snap candidates of one modal session.
+
+    The world-space superset (points of every visible object, with the
+    object each point belongs to and that object's matrix and bound box)
+    is gathered once when the session starts and extended incrementally
+    as the operator creates geometry. Queries run against a screen grid of
+    the projected points (sorted cell keys, built with one argsort); on a
+    view change only the frustum cull, the projection and the sort are
+    redone, all vectorized, and the scene is not walked again. Points added
+    since the last build are scanned linearly until there are enough of
+    them to be worth a rebuild.
+    """
+
+    MAX_PENDING = 256
+    CELL_PX = 32.0
+
+    def __init__(self, matrices, boxes, points, owners, stats=None):
+        self._matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+        self._boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 8, 3)
+        self._points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        # row in _matrices / _boxes per point; -1 = added this session
+        self._owners = np.asarray(owners, dtype=np.int64).reshape(-1)
+        self._pending: list[np.ndarray] = []
+
+        # (cell px, cells per column, sorted cell keys, screen xy, row in
+        # self._points), one entry per projected point in key order
+        self._grid = None
+        self._view_key = None
+        self.last_build_ms = 0.0
+        self.stats = stats if stats is not None else {}
+
+    def __len__(self):
+        return len(self._points) + len(self._pending)
+
+    # ---------- build ----------
+
+    def insert(self, points):
+        for co in np.asarray(points, dtype=np.float64).reshape(-1, 3):
+            self._pending.append(co)
+
+        if len(self._pending) > self.MAX_PENDING:
+            self._merge_pending()
+
+    def _merge_pending(self):
+        pending = np.asarray(self._pending)
+        self._points = np.vstack([self._points, pending])
+        self._owners = np.concatenate(
+            [self._owners, np.full(len(pending), -1, dtype=np.int64)]
+        )
+        self._pending.clear()
+        self._grid = None
+
+    # ---------- query ----------
+
+    def nearest(self, region, rv3d, mouse, radius: float):
+        """
+        World point whose projection is closest to `mouse` (region px)
+        within `radius`, or None.
+        """
+        self._ensure_grid(region, rv3d)
+
+        best = None  # (world_co, dist)
+
+        rows = self._grid_query(mouse, radius)
+        if rows is not None:
+            _cell, _ny, _keys, screen, ids = self._grid
+            index, dist = nearest_within(
+                screen[rows], np.ones(len(rows), dtype=bool), mouse, radius
+            )
+            if index >= 0:
+                best = (self._points[ids[rows[index]]], dist)
+
+        if self._pending:
+            pending = np.asarray(self._pending)
+            screen, visible = project_points(region, rv3d, pending)
+            index, dist = nearest_within(screen, visible, mouse, radius)
+            if index >= 0 and (best is None or dist < best[1]):
+                best = (pending[index], dist)
+
+        return Vector(best[0]) if best else None
+
+    @staticmethod
+    def view_key(region, rv3d) -> tuple:
+        return region_view_key(region, rv3d)
+
+    def needs_rebuild(self, region, rv3d) -> bool:
+        """
+        True if the next query has to rebuild the grid.
+        """
+        return self._grid is None or self.view_key(region, rv3d) != self._view_key
+
+    def _ensure_grid(self, region, rv3d):
+        view_key = self.view_key(region, rv3d)
+        if self._grid is not None and view_key == self._view_key:
+            return
+
+        t0 = time.perf_counter()
+
+        if self._pending:
+            self._merge_pending()
+
+        self._view_key = view_key
+        self._build_grid(region, rv3d)
+        self.last_build_ms = (time.perf_counter() - t0) * 1e3
+
+    def _build_grid(self, region, rv3d):
+        # per-object frustum cull of the gathered superset; points added
+        # this session (owner -1) are always kept
+        in_frustum = frustum_mask(rv3d, self._matrices, self._boxes)
+        keep = np.append(in_frustum, True)[self._owners]
+        self.stats["frustum_culled"] = int(len(in_frustum) - in_frustum.sum())
+        self.stats["candidates"] = int(in_frustum.sum())
+
+        rows = np.flatnonzero(keep)
+        screen, visible = project_points(region, rv3d, self._points[rows])
+        ids = rows[visible]
+        screen = screen[visible]
+
+        cell = self.CELL_PX
+        ny = int(region.height // cell) + 1
+        keys = (
+            (screen[:, 0] // cell).astype(np.int64) * ny
+            + (screen[:, 1] // cell).astype(np.int64)
+        )
+        order = np.argsort(keys, kind="stable")
+
+        self._grid = (cell, ny, keys[order], screen[order], ids[order])
+
+    def _grid_query(self, mouse, radius: float) -> np.ndarray | None:
+        """
+        Grid slots of every point in the cells within `radius` of `mouse`.
+        """
+        if self._grid is None:
+            return None
+
+        cell, ny, keys, _screen, _ids = self._grid
+        if not len(keys):
+            return None
+
+        reach = int(np.ceil(radius / cell))
+        cx = int(mouse[0] // cell)
+        cy = int(mouse[1] // cell)
+        xs = np.arange(cx - reach, cx + reach + 1)
+        ys = np.arange(cy - reach, cy + reach + 1)
+        ys = ys[(ys >= 0) & (ys < ny)]
+
+        wanted = (xs[:, None] * ny + ys[None, :]).ravel()
+        lo = np.searchsorted(keys, wanted, side="left")
+        hi = np.searchsorted(keys, wanted, side="right")
+        hit = hi > lo
+        if not hit.any():
+            return None
+
+        return np.concatenate(
+            [np.arange(a, b) for a, b in zip(lo[hit], hi[hit])]
+        )
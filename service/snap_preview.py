@@ -0,0 +1,165 @@
+# blender_adapter/service/snap_preview.py
+
+import math
+import time
+
+import bpy
+import gpu
+from bpy_extras import view3d_utils
+from gpu_extras.batch import batch_for_shader
+
+from blender_adapter.service.snap_index import SnapIndex
+
+
+class SnapPreview:
+    """
+    Hover preview of the snap target for modal draw operators.
+
+    MOUSEMOVE is cheap by construction:
+    - nothing is computed unless the snap modifier is held
+    - the cursor is bucketed into cells of `cell_px`; while it stays in
+      the same cell (same view, same modifier) the last result is reused
+    - before any work, a view change that needs an index rebuild known
+      to be over budget is deferred to the next click / modifier press
+    - every update is timed; if one exceeds `budget_ms` the following
+      MOUSEMOVE events are dropped proportionally (coalesced), up to
+      MAX_SKIP, so the viewport keeps up on huge scenes
+    """
+
+    MAX_SKIP = 8
+    RADIUS_PX = 6.0
+    LINE_WIDTH = 2.0
+    COLOR = (1.0, 0.6, 0.1, 1.0)
+
+    def __init__(self, snapping, budget_ms: float = 4.0, cell_px: float | None = None):
+        self.snapping = snapping
+        self.budget_ms = budget_ms
+        self.cell_px = cell_px or max(1.0, snapping.snap_threshold * 0.5)
+
+        self.point = None          # current snap target (world) or None
+        self.last_ms = 0.0
+        self._cell_key = None
+        self._skip = 0
+        self._handle = None
+        self._area = None
+
+    # ---------- lifecycle ----------
+
+    def enable(self, context):
+        self._area = context.area
+        if self._handle is None:
+            self._handle = bpy.types.SpaceView3D.draw_handler_add(
+                self._draw, (), 'WINDOW', 'POST_PIXEL'
+            )
+
+    def disable(self):
+        if self._handle is not None:
+            bpy.types.SpaceView3D.draw_handler_remove(self._handle, 'WINDOW')
+            self._handle = None
+        self._set_point(None)
+        self._area = None
+
+    def invalidate(self):
+        """
+        Forget the cached cell (snap candidates changed).
+        """
+        self._cell_key = None
+        self._skip = 0
+
+    # ---------- events ----------
+
+    def update(self, context, event, force: bool = False):
+        """
+        Refresh the preview for `event`; returns the snap target or None.
+        `force` bypasses coalescing and deferral (explicit user intent).
+        """
+        if not self.snapping.should_snap(event):
+            self._cell_key = None
+            self._set_point(None)
+            return None
+
+        region = context.region
+        rv3d = context.region_data
+
+        # the rebuild would be the expensive part: decide before doing it
+        index = self.snapping._index
+        if (
+            not force
+            and index is not None
+            and index.last_build_ms > self.budget_ms
+            and index.needs_rebuild(region, rv3d)
+        ):
+            self._cell_key = None
+            self._set_point(None)
+            return None
+
+        if not force and self._skip > 0:
+            self._skip -= 1
+            return self.point
+
+        cell_key = (
+            int(event.mouse_region_x // self.cell_px),
+            int(event.mouse_region_y // self.cell_px),
+            SnapIndex.view_key(region, rv3d),
+        )
+        if not force and cell_key == self._cell_key:
+            return self.point
+
+        t0 = time.perf_counter()
+        point = self.snapping.find_snap(context, event)
+        self.last_ms = (time.perf_counter() - t0) * 1e3
+
+        if self.last_ms > self.budget_ms:
+            self._skip = min(self.MAX_SKIP, int(self.last_ms // self.budget_ms))
+
+        self._cell_key = cell_key
+        self._set_point(point)
+        return point
+
+    def _set_point(self, point):
+        if point is None and self.point is None:
+            return
+        if point is not None and self.point is not None and point == self.point:
+            return
+
+        self.point = point
+        if self._area is not None:
+            self._area.tag_redraw()
+
+    # ---------- drawing ----------
+
+    def _draw(self):
+        if self.point is None:
+            return
+
+        context = bpy.context
+        if context.area != self._area:
+            return
+
+        coord = view3d_utils.location_3d_to_region_2d(
+            context.region, context.region_data, self.point
+        )
+        if coord is None:
+            return
+
+        segments = 16
+        circle = [
+            (
+                coord.x + self.RADIUS_PX * math.cos(2 * math.pi * i / segments),
+                coord.y + self.RADIUS_PX * math.sin(2 * math.pi * i / segments),
+            )
+            for i in range(segments + 1)
+        ]
+
+        # line_width_set is ignored by Metal / Vulkan: use the polyline
+        # shader, which draws wide lines itself
+        region = context.region
+        shader = gpu.shader.from_builtin('POLYLINE_UNIFORM_COLOR')
+        batch = batch_for_shader(shader, 'LINE_STRIP', {"pos": circle})
+
+        gpu.state.blend_set('ALPHA')
+        shader.uniform_float("viewportSize", (region.width, region.height))
+        shader.uniform_float("lineWidth", self.LINE_WIDTH)
+        shader.uniform_float("color", self.COLOR)
+        batch.draw(shader)
+        gpu.state.blend_set('NONE')
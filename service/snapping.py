@@ -1,111 +1,180 @@
+import logging
+
+import bpy
 import mathutils
+import numpy as np
 from bpy_extras import view3d_utils
 
-from blender_adapter.crud.node import BlenderNodeAdapter
-from blender_adapter.crud.frame import BlenderFrameAdapter
-
-from blender_adapter.utils.is_object import is_plain_empty, is_plain_mesh
+from blender_adapter.core.base import DomainKind
+from blender_adapter.core.frame import BlenderFrame
+from blender_adapter.crud.frame_store import FrameEdgeStore
+from blender_adapter.service.registry import classify
+from blender_adapter.service.snap_bvh import snap_reference
+from blender_adapter.service.snap_cache import snap_point_cache
+from blender_adapter.service.snap_index import SnapIndex
+from blender_adapter.service.wrappers import wrapper_cache
+
+from blender_adapter.utils.projection import (
+    frustum_mask,
+    nearest_on_segments,
+    nearest_within,
+    project_points,
+)
+from blender_adapter.utils.geometry import (
+    centroid,
+    extremes,
+    segment_midpoints,
+    world_vertices,
+)
+
+log = logging.getLogger("BlenderAdapter")
+
+class SnapKind:
+    NODE = DomainKind.NODE
+    FRAME = DomainKind.FRAME
+    FRAME_STORE = DomainKind.FRAME_STORE
+    EMPTY = "EMPTY"   # plain (non-node) empty
+    MESH = "MESH"     # plain (non-frame) mesh
+
+def frame_endpoints(obj):
+    """
+    World (start, end) of a frame object via its cached wrapper.
+    """
+    frame = wrapper_cache.get(obj, BlenderFrame)
+    return frame.endpoints() if frame is not None else None
 
 # ---------- SNAP PROVIDERS ----------
+# Providers only run on objects of the kind they are registered for,
+# so they do not re-check the object type themselves.
+
 def snap_plain_empty_origin(obj):
     """
     Snap to EMPTY object origin (non-node)
     """
-    if not is_plain_empty(obj):
-        return
-
     yield obj.matrix_world.translation
 
 def snap_plain_mesh_endpoints(obj):
     """
     Snap to mesh extreme vertices (non-frame)
     """
-    if not is_plain_mesh(obj):
+    if not obj.data.vertices:
         return
 
-    mesh = obj.data
-    if not mesh.vertices:
-        return
-
-    # world-space vertices
-    verts = [obj.matrix_world @ v.co for v in mesh.vertices]
-
     # choose extremes (bounding box corners approximation)
-    min_v = min(verts, key=lambda v: (v.x, v.y, v.z))
-    max_v = max(verts, key=lambda v: (v.x, v.y, v.z))
+    min_v, max_v = extremes(world_vertices(obj))
 
-    yield min_v
-    yield max_v
+    yield mathutils.Vector(min_v)
+    yield mathutils.Vector(max_v)
 
 def snap_plain_mesh_midpoint(obj):
     """
-    Snap to mesh bounding-box center (non-frame)
+    Snap to mesh vertex centroid (non-frame)
     """
-    if not is_plain_mesh(obj):
+    if not obj.data.vertices:
         return
 
-    mesh = obj.data
-    if not mesh.vertices:
-        return
-
-    verts = [obj.matrix_world @ v.co for v in mesh.vertices]
-
-    center = sum(verts, mathutils.Vector()) / len(verts)
-    yield center
+    yield mathutils.Vector(centroid(world_vertices(obj)))
 
 def snap_node_points(obj):
     """
     Snap to node origins
     """
-    node = BlenderNodeAdapter.get_by_object(obj)
-    if not node:
-        return
-
-    yield node.obj.matrix_world.translation
+    yield obj.matrix_world.translation
 
 def snap_frame_endpoints(obj):
     """
     Snap to frame start & end points
     """
-    frame = BlenderFrameAdapter.get_by_object(obj)
-    if not frame:
-        return
-
-    mesh = frame.obj.data
-    if not mesh or len(mesh.vertices) < 2:
+    ends = frame_endpoints(obj)
+    if ends is None:
         return
 
-    yield frame.obj.matrix_world @ mesh.vertices[0].co
-    yield frame.obj.matrix_world @ mesh.vertices[1].co
+    yield from ends
 
 def snap_frame_midpoint(obj):
     """
     Snap to frame midpoint
     """
-    frame = BlenderFrameAdapter.get_by_object(obj)
-    if not frame:
-        return
-
-    mesh = frame.obj.data
-    if not mesh or len(mesh.vertices) < 2:
+    ends = frame_endpoints(obj)
+    if ends is None:
         return
 
-    v0 = frame.obj.matrix_world @ mesh.vertices[0].co
-    v1 = frame.obj.matrix_world @ mesh.vertices[1].co
+    v0, v1 = ends
     yield (v0 + v1) * 0.5
 
-# Central registry (order matters)
-SNAP_PROVIDERS = [
-    # ---- domain-aware ----
-    snap_node_points,
-    snap_frame_endpoints,
-    snap_frame_midpoint,
+def snap_frame_store_points(obj):
+    """
+    Snap to endpoints & midpoints of frames held in a frame store mesh
+    """
+    segments = FrameEdgeStore.segments(obj)
+    midpoints = segment_midpoints(segments)
+
+    for (start, end), mid in zip(segments, midpoints):
+        yield mathutils.Vector(start)
+        yield mathutils.Vector(end)
+        yield mathutils.Vector(mid)
+
+class SnapProviderRegistry:
+    """
+    kind → providers. Each object is classified once (cached in
+    snap_point_cache, invalidated by depsgraph / undo) and only the
+    providers of its kind run. Providers can be (un)registered at runtime.
+    """
+
+    def __init__(self):
+        self._providers: dict[str, list] = {}
+
+    def register(self, kind: str, provider, index: int | None = None):
+        providers = self._providers.setdefault(kind, [])
+        if provider in providers:
+            return
+        if index is None:
+            providers.append(provider)
+        else:
+            providers.insert(index, provider)
+
+    def unregister(self, provider):
+        for providers in self._providers.values():
+            if provider in providers:
+                providers.remove(provider)
+
+    def providers(self, kind: str | None) -> list:
+        return self._providers.get(kind, [])
 
-    # ---- generic objects ----
-    snap_plain_empty_origin,
-    snap_plain_mesh_endpoints,
-    snap_plain_mesh_midpoint,
-]
+    @staticmethod
+    def classify(obj) -> str | None:
+        key = classify(obj)
+        if key is not None:
+            return key[0]
+
+        if obj.type == 'EMPTY':
+            return SnapKind.EMPTY
+
+        if obj.type == 'MESH' and obj.data is not None:
+            return SnapKind.MESH
+
+        return None
+
+    def kind_of(self, obj) -> str | None:
+        return snap_point_cache.kind(obj, self.classify)
+
+    def points(self, obj):
+        for provider in self.providers(self.kind_of(obj)):
+            yield from provider(obj)
+
+# Central registry (order within a kind matters)
+SNAP_PROVIDERS = SnapProviderRegistry()
+
+# ---- domain-aware ----
+SNAP_PROVIDERS.register(SnapKind.NODE, snap_node_points)
+SNAP_PROVIDERS.register(SnapKind.FRAME, snap_frame_endpoints)
+SNAP_PROVIDERS.register(SnapKind.FRAME, snap_frame_midpoint)
+SNAP_PROVIDERS.register(SnapKind.FRAME_STORE, snap_frame_store_points)
+
+# ---- generic objects ----
+SNAP_PROVIDERS.register(SnapKind.EMPTY, snap_plain_empty_origin)
+SNAP_PROVIDERS.register(SnapKind.MESH, snap_plain_mesh_endpoints)
+SNAP_PROVIDERS.register(SnapKind.MESH, snap_plain_mesh_midpoint)
 
 class SnappingService:
     """
@@ -113,8 +182,19 @@ class SnappingService:
     considering snapping rules.
     """
 
-    def __init__(self, snap_threshold: float = 10.0):
+    def __init__(
+        self,
+        snap_threshold: float = 10.0,
+        snap_reference: bool = False,
+        snap_on_member: bool = False,
+    ):
         self.snap_threshold = snap_threshold
+        self.snap_reference = snap_reference
+        self.snap_on_member = snap_on_member
+        self._index: SnapIndex | None = None
+        self._references: list | None = None
+        self._segments: list[np.ndarray] | None = None
+        self.cull_stats: dict[str, int] = {}
 
     # ---------- public API ----------
 
@@ -123,6 +203,126 @@ class SnappingService:
             return self._get_snapped_point(context, event)
         return self._get_free_point(context, event)
 
+    # ---------- session (modal operators) ----------
+
+    def begin_session(self, context):
+        """
+        Collect every snap candidate once; later clicks query the index,
+        which only re-culls and re-projects them when the view changes.
+        """
+        self.cull_stats = {}
+        self._index = SnapIndex(*self._superset(context), stats=self.cull_stats)
+
+        # only what the enabled modes need; a mode switched on mid-session
+        # collects its own data on first use (see find_snap)
+        self._references = (
+            self._reference_objects(context) if self.snap_reference else None
+        )
+        self._segments = (
+            [self._frame_segments(context)] if self.snap_on_member else None
+        )
+
+    def add_points(self, points):
+        """
+        Register geometry created during the session.
+        """
+        if self._index is not None:
+            self._index.insert([tuple(co) for co in points])
+
+    def add_segment(self, start, end):
+        """
+        Register a frame drawn during the session (on-member snapping).
+        Not needed while on-member snapping has not collected frames yet:
+        they are read from the scene then.
+        """
+        if self._segments is not None:
+            self._segments.append(
+                np.asarray([tuple(start), tuple(end)], dtype=np.float64)
+            )
+
+    def end_session(self):
+        self._index = None
+        self._references = None
+        self._segments = None
+
+    def _candidates(self, context, region, rv3d) -> np.ndarray:
+        """
+        (N, 3) snap points of every visible, in-frustum object,
+        served from the point cache.
+        """
+        objs = self._culled_objects(context, rv3d)
+        snap_point_cache.reserve(len(objs))
+        chunks = [
+            snap_point_cache.points(obj, self._object_points)
+            for obj in objs
+        ]
+        if not chunks:
+            return np.empty((0, 3))
+        return np.concatenate(chunks)
+
+    def _superset(self, context) -> tuple:
+        """
+        (M, 4, 4) matrices and (M, 8, 3) bound boxes of every visible
+        object, plus their (N, 3) cached snap points and the (N,) object
+        row of each point. View independent: one scene pass per session.
+        """
+        visible = list(context.visible_objects)
+        snap_point_cache.reserve(len(visible))
+        chunks = [
+            snap_point_cache.points(obj, self._object_points)
+            for obj in visible
+        ]
+
+        total = len(context.scene.objects)
+        self.cull_stats["scene"] = total
+        self.cull_stats["hidden_culled"] = total - len(visible)
+
+        if not chunks:
+            return (
+                np.empty((0, 4, 4)),
+                np.empty((0, 8, 3)),
+                np.empty((0, 3)),
+                np.empty(0, dtype=np.int64),
+            )
+
+        return (
+            [obj.matrix_world for obj in visible],
+            [obj.bound_box for obj in visible],
+            np.concatenate(chunks),
+            np.repeat(np.arange(len(chunks)), [len(c) for c in chunks]),
+        )
+
+    def _culled_objects(self, context, rv3d) -> list:
+        """
+        Scene → visible in the view layer → world bbox inside the frustum.
+        Stage counts are kept in `cull_stats`.
+        """
+        visible = list(context.visible_objects)
+
+        in_frustum = []
+        if visible:
+            mask = frustum_mask(
+                rv3d,
+                [obj.matrix_world for obj in visible],
+                [obj.bound_box for obj in visible],
+            )
+            in_frustum = [obj for obj, keep in zip(visible, mask) if keep]
+
+        total = len(context.scene.objects)
+        self.cull_stats = {
+            "scene": total,
+            "hidden_culled": total - len(visible),
+            "frustum_culled": len(visible) - len(in_frustum),
+            "candidates": len(in_frustum),
+        }
+        log.debug(f"Snap culling: {self.cull_stats}")
+
+        return in_frustum
+
+    @staticmethod
+    def _object_points(obj):
+        return [tuple(co) for co in SNAP_PROVIDERS.points(obj)]
+
     # ---------- policy ----------
 
     def should_snap(self, event) -> bool:
@@ -147,34 +347,114 @@ class SnappingService:
     # ---------- snapping ----------
 
     def _get_snapped_point(self, context, event):
+        hit = self.find_snap(context, event)
+        if hit is not None:
+            return hit
+
+        return self._get_free_point(context, event)
+
+    def find_snap(self, context, event):
+        """
+        Snap target under the cursor, or None (no free-point fallback).
+        """
         region = context.region
         rv3d = context.region_data
         mouse = mathutils.Vector(
             (event.mouse_region_x, event.mouse_region_y)
         )
 
-        best = None  # (world_co, dist)
+        if self._index is not None:
+            hit = self._index.nearest(region, rv3d, mouse, self.snap_threshold)
+            if hit is not None:
+                return hit
+        else:
+            points = self._candidates(context, region, rv3d)
 
-        def consider(world_co):
-            nonlocal best
-            screen_co = view3d_utils.location_3d_to_region_2d(
-                region, rv3d, world_co
+            screen, visible = project_points(region, rv3d, points)
+            index, _dist = nearest_within(
+                screen, visible, mouse, self.snap_threshold
             )
-            if screen_co is None:
-                return
-
-            dist = (mouse - screen_co).length
-            if dist < self.snap_threshold and (
-                best is None or dist < best[1]
-            ):
-                best = (world_co, dist)
-
-        for obj in context.scene.objects:
-            for provider in SNAP_PROVIDERS:
-                for world_co in provider(obj):
-                    consider(world_co)
+            if index >= 0:
+                return mathutils.Vector(points[index])
+
+        # ---- on-member (nearest point along any frame) ----
+        if self.snap_on_member:
+            hit = self._get_member_point(context, region, rv3d, mouse)
+            if hit is not None:
+                return hit
+
+        # ---- reference meshes (vertex / edge / face under the cursor) ----
+        if self.snap_reference:
+            references = self._references
+            if references is None:
+                references = self._reference_objects(context)
+                if self._index is not None:
+                    self._references = references   # in session: keep
+
+            hit = snap_reference(
+                region, rv3d, mouse, references, self.snap_threshold
+            )
+            if hit is not None:
+                return hit
+
+        return None
+
+    def _get_member_point(self, context, region, rv3d, mouse):
+        if self._segments is None and self._index is not None:
+            # switched on mid-session: collect once, extended by add_segment
+            self._segments = [self._frame_segments(context)]
+
+        if self._segments is None:
+            segments = self._frame_segments(context)
+        else:
+            # fold frames added this session into one cached array
+            if len(self._segments) > 1:
+                self._segments = [
+                    np.concatenate(
+                        [chunk.reshape(-1, 2, 3) for chunk in self._segments]
+                    )
+                ]
+            segments = self._segments[0]
+
+        index, s, _dist = nearest_on_segments(
+            region, rv3d, segments, mouse, self.snap_threshold
+        )
+        if index < 0:
+            return None
 
-        if best:
-            return best[0]
+        start, end = segments[index]
+        return mathutils.Vector(start + (end - start) * s)
 
-        return self._get_free_point(context, event)
+    @staticmethod
+    def _frame_segments(context) -> np.ndarray:
+        """
+        (N, 2, 3) world-space start/end of every visible frame (objects +
+        stores); hidden, excluded and other scenes' frames are skipped,
+        as for point candidates and reference meshes.
+        """
+        chunks = []
+        ends = []
+
+        for obj in context.visible_objects:
+            kind = SNAP_PROVIDERS.kind_of(obj)
+            if kind == SnapKind.FRAME:
+                pair = frame_endpoints(obj)
+                if pair is not None:
+                    ends.append(tuple(map(tuple, pair)))
+            elif kind == SnapKind.FRAME_STORE:
+                chunks.append(FrameEdgeStore.segments(obj))
+
+        if ends:
+            chunks.append(np.asarray(ends, dtype=np.float64))
+
+        if not chunks:
+            return np.empty((0, 2, 3))
+        return np.concatenate(chunks)
+
+    def _reference_objects(self, context) -> list:
+        # visible only; the ray cast itself rejects anything off-screen
+        return [
+            obj
+            for obj in context.visible_objects
+            if SNAP_PROVIDERS.kind_of(obj) == SnapKind.MESH
+        ]
@@ -0,0 +1,115 @@
+# blender_adapter/service/wrappers.py
+
+import bpy
+
+from blender_adapter.core.frame import ATTR_FRAME_ID, BlenderFrameEdge, FrameRNA
+from blender_adapter.core.node import NodeRNA
+from blender_adapter.service.handlers import handler_dispatcher
+from blender_adapter.service.label.base import AddonService
+
+
+class WrapperCache(AddonService):
+    """
+    One domain wrapper (BlenderNode / BlenderFrame) per object, keyed on
+    obj.as_pointer() and wrapper class, and one BlenderFrameEdge per
+    store frame, keyed on store pointer and frame id, so hot paths stop
+    re-allocating and re-validating them. Only successful wraps are
+    stored.
+
+    Entries hold no strong reference beyond the wrapper's own `obj` and
+    are dropped when they may be wrong:
+    - depsgraph update of the object (re-typed, or new at a reused
+      address) → that object and its store frames
+    - objects removed, NodeRNA / FrameRNA edited (msgbus), undo, load
+      → everything
+    """
+
+    def __init__(self):
+        self._wrappers: dict[int, dict[type, object]] = {}  # pointer → cls → wrapper
+        # store pointer → frame id → wrapper
+        self._edges: dict[int, dict[int, BlenderFrameEdge]] = {}
+        self._count = -1   # len(bpy.data.objects) at last sync
+        self._owner = object()   # msgbus subscription owner
+
+    def get(self, obj, cls):
+        """
+        Cached `cls(obj)`, or None if `obj` is not of that kind.
+        """
+        ptr = obj.as_pointer()
+        entry = self._wrappers.get(ptr)
+        if entry is not None and cls in entry:
+            return entry[cls]
+
+        try:
+            wrapper = cls(obj)
+        except TypeError:
+            return None
+
+        self._wrappers.setdefault(ptr, {})[cls] = wrapper
+        return wrapper
+
+    def edge(self, store, index: int, frame_index: int | None = None):
+        """
+        Cached BlenderFrameEdge for edge `index` of `store`. Pass
+        `frame_index` when it is already known (saves an attribute read).
+        """
+        if frame_index is None:
+            frame_index = store.data.attributes[ATTR_FRAME_ID].data[index].value
+
+        frames = self._edges.setdefault(store.as_pointer(), {})
+        wrapper = frames.get(frame_index)
+        if wrapper is None:
+            wrapper = frames[frame_index] = BlenderFrameEdge(
+                store, index, frame_index
+            )
+        else:
+            wrapper._index = index   # current position, skips re-resolving
+
+        return wrapper
+
+    def discard(self, obj):
+        ptr = obj.as_pointer()
+        self._wrappers.pop(ptr, None)
+        self._edges.pop(ptr, None)
+
+    def clear(self, *_args):
+        self._wrappers.clear()
+        self._edges.clear()
+
+    def __len__(self):
+        return len(self._wrappers) + sum(map(len, self._edges.values()))
+
+    # ---------- handlers ----------
+
+    def _on_depsgraph_update(self, updates):
+        if not (self._wrappers or self._edges):
+            self._count = len(bpy.data.objects)
+            return
+
+        count = len(bpy.data.objects)
+        if count < self._count:
+            self.clear()
+        self._count = count
+
+        for obj in updates.objects:
+            self.discard(obj)
+
+    # ---------- AddonService ----------
+
+    def enable(self):
+        self.clear()
+        handler_dispatcher.subscribe_rna(
+            self._owner, [(NodeRNA, self.clear), (FrameRNA, self.clear)]
+        )
+        # pointers are not stable across undo / load
+        handler_dispatcher.subscribe_file(self.clear)
+        handler_dispatcher.subscribe_update(self._on_depsgraph_update)
+
+    def disable(self):
+        handler_dispatcher.unsubscribe(self.clear)
+        handler_dispatcher.unsubscribe(self._on_depsgraph_update)
+        handler_dispatcher.unsubscribe_rna(self._owner)
+        self.clear()
+
+
+wrapper_cache = WrapperCache()
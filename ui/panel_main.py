@@ -29,6 +29,45 @@ class SoM_DisplaySettings(bpy.types.PropertyGroup):
         default=True
     )
 
+    # -------------------------
+    # Declutter / level of detail
+    # -------------------------
+    declutter_labels: bpy.props.BoolProperty( # type: ignore
+        name="Declutter",
+        description="Draw at most one label per screen cell (selected and active first)",
+        default=False
+    )
+
+    declutter_cell: bpy.props.IntProperty( # type: ignore
+        name="Cell Size",
+        description="Declutter cell size in pixels",
+        default=48,
+        min=8,
+        soft_max=256,
+        subtype='PIXEL'
+    )
+
+    max_labels: bpy.props.IntProperty( # type: ignore
+        name="Max Labels",
+        description="Label budget per redraw (0 = unlimited)",
+        default=0,
+        min=0
+    )
+
+class SoM_ModelSettings(bpy.types.PropertyGroup):
+    # -------------------------
+    # Frame storage backend
+    # -------------------------
+    frame_storage: bpy.props.EnumProperty( # type: ignore
+        name="Frame Storage",
+        items=(
+            ('OBJECT', "Object per Frame", "One object and mesh per frame"),
+            ('SHARED', "Shared Mesh", "One object per frame, endpoints in the transform of a shared unit mesh"),
+            ('EDGES', "Single Mesh", "All frames of a collection as edges of one mesh"),
+        ),
+        default='OBJECT',
+    )
+
 class SoM_main_panel(bpy.types.Panel):
     bl_label = "Structural object Modeler"
     bl_idname = "SoM_main_panel"
@@ -47,6 +86,7 @@ class SoM_main_panel(bpy.types.Panel):
         layout.label(text="Geometry", icon='MESH_DATA')
         layout.operator("som.create_node_modal", icon='GREASEPENCIL')
         layout.operator("som.create_frame_modal", icon='GREASEPENCIL')
+        layout.prop(scene.som_model, "frame_storage", text="Storage")
 
         # -------------------------------------------------
         # Transform
@@ -57,6 +97,7 @@ class SoM_main_panel(bpy.types.Panel):
         layout.operator("som.move_object", icon='EMPTY_AXIS')
         layout.operator("som.delete_object", icon='EMPTY_AXIS')
         layout.operator("som.replicate_object", icon='EMPTY_AXIS')
+        layout.operator("som.pattern_array", icon='MOD_ARRAY')
 
         layout.separator()
         layout.operator("som.set_origin_to_geometry", icon='PIVOT_MEDIAN')
@@ -79,6 +120,15 @@ class SoM_main_panel(bpy.types.Panel):
         col.prop(display, "show_frame_id", text="ID")
         col.prop(display, "show_frame_label", text="Label")
 
+        layout.separator()
+
+        col = layout.column(align=True)
+        col.prop(display, "declutter_labels")
+        sub = col.column(align=True)
+        sub.active = display.declutter_labels
+        sub.prop(display, "declutter_cell")
+        col.prop(display, "max_labels")
+
 
 class OBJECT_panel_node(bpy.types.Panel):
     bl_label = "Node Data"
@@ -0,0 +1,114 @@
+# blender_adapter/utils/geometry.py
+
+import numpy as np
+
+
+# ---------- READ ----------
+
+def local_vertices(mesh) -> np.ndarray:
+    """
+    Mesh vertex coordinates as an (N, 3) float64 array (one foreach_get).
+    """
+    buf = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", buf)
+    return buf.reshape(-1, 3).astype(np.float64)
+
+
+def world_vertices(obj) -> np.ndarray:
+    return transform_points(obj.matrix_world, local_vertices(obj.data))
+
+
+# ---------- TRANSFORM ----------
+
+def transform_points(matrix, points: np.ndarray) -> np.ndarray:
+    """
+    Apply a 4x4 (mathutils or array) matrix to (N, 3) points.
+    """
+    m = np.asarray(matrix, dtype=np.float64)
+    return points @ m[:3, :3].T + m[:3, 3]
+
+
+# ---------- KERNELS ----------
+
+def centroid(points: np.ndarray) -> np.ndarray:
+    return points.mean(axis=0)
+
+
+def extremes(points: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Lexicographic (x, y, z) min and max points.
+    """
+    order = np.lexsort((points[:, 2], points[:, 1], points[:, 0]))
+    return points[order[0]], points[order[-1]]
+
+
+def segment_midpoints(segments: np.ndarray) -> np.ndarray:
+    """
+    (N, 2, 3) start/end pairs → (N, 3) midpoints.
+    """
+    return segments.mean(axis=1)
+
+
+# ---------- PATTERNS ----------
+# Pattern instances are (K, 4, 4) transforms; the source itself is
+# never part of the stack.
+
+def translations(offsets) -> np.ndarray:
+    """
+    (K, 3) offsets → (K, 4, 4) pure translations.
+    """
+    offsets = np.asarray(offsets, dtype=np.float64).reshape(-1, 3)
+    mats = np.tile(np.eye(4), (len(offsets), 1, 1))
+    mats[:, :3, 3] = offsets
+    return mats
+
+
+def linear_pattern(step, count: int) -> np.ndarray:
+    """
+    `count` copies at step, 2·step, …
+    """
+    k = np.arange(1, count + 1, dtype=np.float64)[:, None]
+    return translations(k * np.asarray(step, dtype=np.float64))
+
+
+def grid_pattern(counts, spacing) -> np.ndarray:
+    """
+    nx × ny × nz grid of copies (the source cell (0, 0, 0) excluded).
+    """
+    nx, ny, nz = (max(1, int(n)) for n in counts)
+    ijk = np.stack(
+        np.meshgrid(np.arange(nx), np.arange(ny), np.arange(nz), indexing="ij"),
+        axis=-1,
+    ).reshape(-1, 3)[1:]
+    return translations(ijk * np.asarray(spacing, dtype=np.float64))
+
+
+def polar_pattern(angle: float, count: int, center=(0.0, 0.0, 0.0)) -> np.ndarray:
+    """
+    `count` copies rotated by angle, 2·angle, … (radians) about the
+    world Z axis through `center`.
+    """
+    theta = angle * np.arange(1, count + 1, dtype=np.float64)
+    c, s = np.cos(theta), np.sin(theta)
+
+    mats = np.tile(np.eye(4), (count, 1, 1))
+    mats[:, 0, 0] = c
+    mats[:, 0, 1] = -s
+    mats[:, 1, 0] = s
+    mats[:, 1, 1] = c
+
+    # rotate about `center`: p' = R (p - c) + c
+    center = np.asarray(center, dtype=np.float64)
+    mats[:, :3, 3] = center - mats[:, :3, :3] @ center
+    return mats
+
+
+def transform_stack(mats: np.ndarray, points: np.ndarray) -> np.ndarray:
+    """
+    (K, 4, 4) transforms × (N, 3) points → (K, N, 3), one einsum.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    return (
+        np.einsum("kij,nj->kni", mats[:, :3, :3], points)
+        + mats[:, None, :3, 3]
+    )
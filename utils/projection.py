@@ -0,0 +1,186 @@
+# blender_adapter/utils/projection.py
+
+import itertools
+
+import numpy as np
+
+
+def region_view_key(region, rv3d) -> tuple:
+    """
+    Hashable key that changes whenever projected coordinates would.
+    """
+    return (
+        region.width,
+        region.height,
+        *itertools.chain.from_iterable(rv3d.perspective_matrix),
+    )
+
+
+def clip_coords(rv3d, points) -> np.ndarray:
+    """
+    (N, 3) world points → (N, 4) homogeneous clip coordinates.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    m = np.asarray(rv3d.perspective_matrix, dtype=np.float64)
+    return points @ m[:, :3].T + m[:, 3]
+
+
+def project_points(region, rv3d, points) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized view3d_utils.location_3d_to_region_2d.
+
+    (N, 3) world points → (N, 2) region pixels and an (N,) mask that is
+    False for points behind the camera or outside the region rectangle.
+    The perspective matrix is read once for the whole batch.
+    """
+    clip = clip_coords(rv3d, points)
+    w = clip[:, 3]
+
+    visible = w > 0.0
+    safe_w = np.where(visible, w, 1.0)
+
+    half_w = region.width / 2.0
+    half_h = region.height / 2.0
+    screen = np.empty((len(points), 2))
+    screen[:, 0] = half_w + half_w * clip[:, 0] / safe_w
+    screen[:, 1] = half_h + half_h * clip[:, 1] / safe_w
+
+    visible &= (
+        (screen[:, 0] >= 0.0)
+        & (screen[:, 0] <= region.width)
+        & (screen[:, 1] >= 0.0)
+        & (screen[:, 1] <= region.height)
+    )
+    return screen, visible
+
+
+def nearest_within(screen, visible, mouse, radius: float) -> tuple[int, float]:
+    """
+    Index and pixel distance of the visible point closest to `mouse`,
+    or (-1, inf) if none lies within `radius`.
+    """
+    if not len(screen):
+        return -1, float("inf")
+
+    d2 = np.sum((screen - np.asarray(mouse, dtype=np.float64)) ** 2, axis=1)
+    d2[~visible] = np.inf
+
+    index = int(np.argmin(d2))
+    dist = float(np.sqrt(d2[index]))
+    if dist < radius:
+        return index, dist
+    return -1, float("inf")
+
+
+def closest_on_segments_2d(a, b, mouse) -> tuple[np.ndarray, np.ndarray]:
+    """
+    (N, 2) screen segments a→b → clamped parameter t and pixel distance
+    of the closest point to `mouse` on each.
+    """
+    mouse = np.asarray(mouse, dtype=np.float64)
+    ab = b - a
+    denom = np.einsum("ij,ij->i", ab, ab)
+    t = np.einsum("ij,ij->i", mouse - a, ab) / np.where(denom > 0.0, denom, 1.0)
+    t = np.clip(t, 0.0, 1.0)
+    closest = a + ab * t[:, None]
+    return t, np.linalg.norm(closest - mouse, axis=1)
+
+
+def nearest_on_segments(region, rv3d, segments, mouse, radius: float):
+    """
+    Closest point to `mouse` over (N, 2, 3) world segments, in one pass.
+
+    Returns (segment index, world parameter s, pixel distance), or
+    (-1, 0.0, inf) if nothing lies within `radius`. The screen-space
+    parameter is mapped back to world space perspective-correctly:
+        s = t * w_a / ((1 - t) * w_b + t * w_a)
+    Segments with an endpoint behind the camera are skipped.
+    """
+    miss = (-1, 0.0, float("inf"))
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2, 3)
+    n = len(segments)
+    if not n:
+        return miss
+
+    # region-rect masks are ignored: a member may cross the view with
+    # both ends off-screen, and the radius test rejects far points anyway
+    a_screen, _ = project_points(region, rv3d, segments[:, 0])
+    b_screen, _ = project_points(region, rv3d, segments[:, 1])
+
+    w = clip_coords(rv3d, segments.reshape(-1, 3))[:, 3].reshape(n, 2)
+    in_front = (w > 0.0).all(axis=1)
+
+    t, dist = closest_on_segments_2d(a_screen, b_screen, mouse)
+    dist[~in_front] = np.inf
+
+    index = int(np.argmin(dist))
+    if dist[index] >= radius:
+        return miss
+
+    wa, wb = w[index]
+    ti = t[index]
+    denom = (1.0 - ti) * wb + ti * wa
+    s = ti * wa / denom if denom > 0.0 else ti
+    return index, float(s), float(dist[index])
+
+
+def frustum_mask(rv3d, matrices, boxes) -> np.ndarray:
+    """
+    (N, 4, 4) world matrices + (N, 8, 3) local bound boxes → (N,) mask,
+    False where all 8 corners lie outside the same clip plane.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 8, 3)
+    if not len(boxes):
+        return np.zeros(0, dtype=bool)
+
+    m = np.asarray(rv3d.perspective_matrix, dtype=np.float64)
+    mvp = np.einsum("ij,njk->nik", m, matrices)
+
+    corners = np.concatenate([boxes, np.ones((len(boxes), 8, 1))], axis=2)
+    clip = np.einsum("nij,nkj->nki", mvp, corners)   # (N, 8, 4)
+
+    x, y, z, w = clip[..., 0], clip[..., 1], clip[..., 2], clip[..., 3]
+    outside = (
+        (x < -w).all(axis=1) | (x > w).all(axis=1)
+        | (y < -w).all(axis=1) | (y > w).all(axis=1)
+        | (z < -w).all(axis=1) | (z > w).all(axis=1)
+    )
+    return ~outside
+
+
+def cursor_mask(region, rv3d, matrices, boxes, mouse, radius: float) -> np.ndarray:
+    """
+    (N, 4, 4) world matrices + (N, 8, 3) local bound boxes → (N,) mask,
+    True where the screen rectangle of the box, grown by `radius` px,
+    contains `mouse` (the cursor ray may hit the object or pass within
+    `radius` of it). Boxes reaching behind the camera are kept.
+    """
+    matrices = np.asarray(matrices, dtype=np.float64).reshape(-1, 4, 4)
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 8, 3)
+    if not len(boxes):
+        return np.zeros(0, dtype=bool)
+
+    m = np.asarray(rv3d.perspective_matrix, dtype=np.float64)
+    mvp = np.einsum("ij,njk->nik", m, matrices)
+
+    corners = np.concatenate([boxes, np.ones((len(boxes), 8, 1))], axis=2)
+    clip = np.einsum("nij,nkj->nki", mvp, corners)   # (N, 8, 4)
+
+    w = clip[..., 3]
+    behind = (w <= 0.0).any(axis=1)
+    safe_w = np.where(w > 0.0, w, 1.0)
+
+    half_w = region.width / 2.0
+    half_h = region.height / 2.0
+    x = half_w + half_w * clip[..., 0] / safe_w
+    y = half_h + half_h * clip[..., 1] / safe_w
+
+    mx, my = float(mouse[0]), float(mouse[1])
+    inside = (
+        (x.min(axis=1) - radius <= mx)
+        & (x.max(axis=1) + radius >= mx)
+        & (y.min(axis=1) - radius <= my)
+        & (y.max(axis=1) + radius >= my)
+    )
+    return inside | behind